@@ -0,0 +1,173 @@
+# Standard library imports
+import enum
+import os
+import shutil
+import subprocess
+import sys
+import types
+
+# Third-party imports
+import pytest
+from moviepy.config import get_setting
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication, QWidget
+
+# The tests never play anything, and build machines often lack the audio
+# libraries the real QtMultimedia plugin links against, so the multimedia
+# modules are replaced by a minimal backend that also counts the players
+# the app creates.
+
+
+class QMediaPlayer(QObject):
+    class MediaStatus(enum.Enum):
+        NoMedia = 0
+        LoadedMedia = 1
+        EndOfMedia = 2
+        InvalidMedia = 3
+        BufferedMedia = 4
+
+    class PlaybackState(enum.Enum):
+        StoppedState = 0
+        PlayingState = 1
+        PausedState = 2
+
+    class Loops(enum.IntEnum):
+        Infinite = -1
+        Once = 1
+
+    PlayingState = PlaybackState.PlayingState
+    EndOfMedia = MediaStatus.EndOfMedia
+
+    mediaStatusChanged = Signal(object)
+    errorOccurred = Signal(object, str)
+    positionChanged = Signal(int)
+    durationChanged = Signal(int)
+    playbackStateChanged = Signal(object)
+
+    created = 0
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        QMediaPlayer.created += 1
+        self.source = None
+        self.loops = 1
+        self.state = self.PlaybackState.StoppedState
+        self.pos = 0
+
+    def setSource(self, source):
+        self.source = source
+
+    def setLoops(self, loops):
+        self.loops = loops
+
+    def setPlaybackRate(self, rate):
+        pass
+
+    def setAudioOutput(self, output):
+        pass
+
+    def setVideoOutput(self, output):
+        pass
+
+    def play(self):
+        self.state = self.PlaybackState.PlayingState
+
+    def pause(self):
+        self.state = self.PlaybackState.PausedState
+
+    def stop(self):
+        self.state = self.PlaybackState.StoppedState
+
+    def playbackState(self):
+        return self.state
+
+    def setPosition(self, position):
+        self.pos = position
+
+    def position(self):
+        return self.pos
+
+
+class QAudioOutput(QObject):
+    def setVolume(self, volume):
+        pass
+
+
+class QSoundEffect(QObject):
+    def setSource(self, source):
+        pass
+
+    def play(self):
+        pass
+
+
+class QVideoWidget(QWidget):
+    pass
+
+
+multimedia = types.ModuleType("PySide6.QtMultimedia")
+multimedia.QMediaPlayer = QMediaPlayer
+multimedia.QAudioOutput = QAudioOutput
+multimedia.QSoundEffect = QSoundEffect
+multimedia.QMediaDevices = type("QMediaDevices", (QObject,), {})
+multimedia_widgets = types.ModuleType("PySide6.QtMultimediaWidgets")
+multimedia_widgets.QVideoWidget = QVideoWidget
+sys.modules["PySide6.QtMultimedia"] = multimedia
+sys.modules["PySide6.QtMultimediaWidgets"] = multimedia_widgets
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@pytest.fixture(scope="session")
+def synthetic_clip(tmp_path_factory):
+    """A short test-pattern clip, standing in for a dataset sign"""
+    path = str(tmp_path_factory.mktemp("clips") / "testsrc.mp4")
+    subprocess.run(
+        [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+         '-f', 'lavfi', '-i', 'testsrc=size=320x240:rate=30:duration=0.5',
+         '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', path],
+        check=True, capture_output=True
+    )
+    return path
+
+
+@pytest.fixture
+def make_dataset(tmp_path, synthetic_clip):
+    """Build a dataset directory with a copy of the test clip for every gloss"""
+    def make(glosses):
+        directory = tmp_path / "dataset"
+        directory.mkdir(exist_ok=True)
+        for gloss in glosses:
+            shutil.copy(synthetic_clip, directory / f"{gloss.replace(' ', '-')}.mp4")
+        return str(directory)
+    return make
+
+
+@pytest.fixture
+def segment_cache(tmp_path, monkeypatch):
+    """Render into an empty segment cache instead of the one in text-to-sign/cache"""
+    from ui import segment_cache, transitions
+
+    cache = segment_cache.SegmentCache(str(tmp_path / "segments"))
+    monkeypatch.setattr(segment_cache, "_cache", cache)
+    monkeypatch.setattr(transitions, "_library", None)
+    return cache
+
+
+@pytest.fixture
+def offline_gloss(monkeypatch):
+    """Skip NLTK, so unknown words are fingerspelled without looking anything up"""
+    from ui import sign_render
+
+    monkeypatch.setattr(sign_render, "tag_words", lambda words: ['n'] * len(words))
+    monkeypatch.setattr(sign_render, "match_vocabulary", lambda word, pos, vocabulary: None)
@@ -0,0 +1,26 @@
+# Third-party imports
+from ui import assets
+from ui.assets import AssetRegistry
+from ui.sign_render import find_video, load_dataset
+
+
+def test_missing_directory_is_found_once_created(tmp_path):
+    registry = AssetRegistry(root=str(tmp_path / "assets"))
+    directory = tmp_path / "dataset"
+
+    assert registry.find(str(directory), "hello") is None
+    directory.mkdir()
+    (directory / "Hello.mp4").write_bytes(b"")
+    assert registry.find(str(directory), "hello") == str(directory / "Hello.mp4")
+
+
+def test_load_dataset_lists_added_clips(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "_registry", AssetRegistry(root=str(tmp_path / "assets")))
+    directory = tmp_path / "dataset"
+    directory.mkdir()
+    (directory / "hello.mp4").write_bytes(b"")
+    assert load_dataset(str(directory)) == ["hello"]
+
+    (directory / "thank-you.mp4").write_bytes(b"")
+    assert load_dataset(str(directory)) == ["hello", "thank you"]
+    assert find_video("thank you", str(directory)) == str(directory / "thank-you.mp4")
@@ -0,0 +1,27 @@
+# Third-party imports
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from ui.compositor import black_frame
+from ui.fingerspelling import get_fingerspelling_cache
+
+
+def test_render_encodes_at_the_output_size_and_rate(tmp_path):
+    cache = get_fingerspelling_cache()
+    output_path = str(tmp_path / "ab.mp4")
+
+    assert cache.render(('a', 'b'), output_path, (320, 240), 30, gap=0.3) == output_path
+    infos = ffmpeg_parse_infos(output_path)
+    assert infos['video_size'] == [320, 240]
+    assert infos['video_fps'] == 30
+    frames = sum(len(cache.letter_frames(letter)) for letter in 'ab') // cache.frame_bytes
+    expected = (frames + round(0.3 * cache.fps)) / cache.fps
+    assert abs(infos['duration'] - expected) < 0.1
+
+
+def test_render_without_known_letters_is_skipped(tmp_path):
+    assert get_fingerspelling_cache().render(('1', '2'), str(tmp_path / "none.mp4"), (320, 240), 30) is None
+
+
+def test_gaps_use_the_shared_black_frame():
+    cache = get_fingerspelling_cache()
+    assert cache.gap_frames(1 / cache.fps) == black_frame(cache.size).tobytes()
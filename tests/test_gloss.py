@@ -0,0 +1,31 @@
+# Standard library imports
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ui import gloss
+
+
+def test_concurrent_first_use_downloads_once(monkeypatch):
+    downloads = []
+
+    def slow_download(names=None):
+        downloads.append(names)
+        time.sleep(0.1)
+        return False
+
+    monkeypatch.setattr(gloss, "_nltk_ready", None)
+    monkeypatch.setattr(gloss, "missing_nltk_resources", lambda: ['wordnet'])
+    monkeypatch.setattr(gloss, "download_nltk_data", slow_download)
+
+    start = threading.Barrier(8)
+
+    def first_use():
+        start.wait()
+        return gloss.ensure_nltk_data()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: first_use(), range(8)))
+
+    assert results == [False] * 8
+    assert len(downloads) == 1
@@ -0,0 +1,78 @@
+# Standard library imports
+import gc
+import os
+
+# Third-party imports
+import pytest
+from PySide6.QtMultimedia import QMediaPlayer
+from PySide6.QtWidgets import QMainWindow, QStackedWidget
+
+from ui import image_cache, learning, media_pool
+from ui.learning_manifests import MODULES
+
+NAVIGATIONS = 1000
+RSS_GROWTH_LIMIT = 16 * 1024 * 1024  # Allowed growth after every page has been built once
+
+
+def resident_bytes():
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+@pytest.fixture
+def window(qapp, tmp_path, monkeypatch):
+    # No background preview indexing, and scaled pictures go to a scratch dir
+    monkeypatch.setattr(learning.PreviewIndexWorker, "run", lambda self: None)
+    monkeypatch.setattr(image_cache, "IMAGE_CACHE_DIR", str(tmp_path / "images"))
+    monkeypatch.setattr(media_pool, "_pool", None)
+
+    # Laid out like MainWindow: the learning section sits at index 4
+    window = QMainWindow()
+    window.content_area = QStackedWidget()
+    window.setCentralWidget(window.content_area)
+    for _ in range(4):
+        window.content_area.addWidget(QStackedWidget())
+    window.learning = learning.LearningSection()
+    window.content_area.addWidget(window.learning)
+    window.show()
+    qapp.processEvents()
+    yield window
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason="reads /proc")
+def test_modules_are_reused_and_release_their_players(qapp, window):
+    section = window.learning
+    content_area = window.content_area
+    players_before = QMediaPlayer.created
+    keys = list(MODULES)
+
+    counts = set()
+    baseline = None
+    for visit in range(NAVIGATIONS):
+        if visit == len(keys):
+            gc.collect()
+            baseline = resident_bytes()
+        key = keys[visit % len(keys)]
+        section.open_module(key)
+        module = content_area.currentWidget()
+        module.show_sign(MODULES[key].rows[0][0])
+        qapp.processEvents()
+        module.go_back()
+        qapp.processEvents()
+        if visit >= len(keys):
+            counts.add(content_area.count())
+
+    # One page per module, created on the first visit and then reused
+    assert counts == {5 + len(keys)}
+    assert len(section.sections) == len(keys)
+    # Leaving a page closes its popup and hands the players back to the pool
+    assert not any(module.sign_display for module in section.sections.values())
+    assert QMediaPlayer.created - players_before <= 2
+    assert len(media_pool.get_media_pool().idle) <= media_pool.MAX_IDLE_PLAYERS
+    # Memory levels off once every module page exists
+    gc.collect()
+    growth = resident_bytes() - baseline
+    assert growth < RSS_GROWTH_LIMIT
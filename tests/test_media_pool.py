@@ -0,0 +1,25 @@
+# Third-party imports
+from PySide6.QtWidgets import QStackedWidget
+
+from ui.media_pool import MediaPlayerPool
+
+
+def test_acquired_surface_is_not_shown_as_a_window(qapp):
+    pool = MediaPlayerPool()
+    pool.release(pool.acquire())
+
+    pooled = pool.acquire()
+    assert pooled.video_widget.parent() is None
+    assert not pooled.video_widget.isVisible()
+
+    # Visibility is up to the widget it is placed in
+    stack = QStackedWidget()
+    stack.addWidget(pooled.video_widget)
+    stack.show()
+    qapp.processEvents()
+    assert pooled.video_widget.isVisible()
+    assert not pooled.video_widget.isWindow()
+
+    pool.release(pooled)
+    assert not pooled.video_widget.isVisible()
+    stack.deleteLater()
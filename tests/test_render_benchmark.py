@@ -0,0 +1,31 @@
+# Standard library imports
+import os
+
+from ui import render_benchmark
+from ui.render_profiles import get_profile
+
+CORPUS = ["hello", "thank you"]
+
+
+def test_every_pass_encodes_from_an_empty_cache(tmp_path, make_dataset, segment_cache, offline_gloss, monkeypatch):
+    videos_path = make_dataset(["hello", "thank you"])
+    caches = []
+
+    class RecordingCache(render_benchmark.SegmentCache):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            caches.append(self)
+
+    monkeypatch.setattr(render_benchmark, "SegmentCache", RecordingCache)
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    result = render_benchmark.benchmark_profile(get_profile('mobile'), CORPUS, ["hello", "thank you"],
+                                                videos_path, str(work_dir), repeat=2)
+
+    assert result['failed'] == 0
+    # Both passes encoded both signs; the shared cache was never consulted
+    assert len(caches) == 2
+    assert all(cache.misses >= 2 for cache in caches)
+    assert segment_cache.hits == segment_cache.misses == 0
+    assert not any(name.startswith("segments_") for name in os.listdir(work_dir))
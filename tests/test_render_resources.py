@@ -0,0 +1,131 @@
+# Standard library imports
+import itertools
+import os
+import string
+import threading
+
+# Third-party imports
+import pytest
+from moviepy.config import get_setting
+
+from ui import sign_render
+from ui.render_profiles import get_profile
+from ui.sign_render import stream_text_to_sign, text_to_sign
+
+pytestmark = pytest.mark.skipif(not os.path.exists('/proc/self/status'), reason="reads /proc")
+
+SIGNS = 8
+RSS_GROWTH_LIMIT = 32 * 1024 * 1024  # Allowed peak growth from SIGNS to 6 * SIGNS signs
+
+
+def process_tree():
+    """Parent pid of every process, from /proc"""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as file:
+                    fields = file.read().rsplit(')', 1)[1].split()
+            except OSError:
+                continue
+            parents[int(entry)] = int(fields[1])
+    return parents
+
+
+def command_line(pid):
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as file:
+            return file.read().split(b'\0')
+    except OSError:
+        return []
+
+
+def resident_bytes():
+    with open('/proc/self/status') as file:
+        for line in file:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class ResourceSampler(threading.Thread):
+    """Polls this process's RSS and the ffmpeg processes below it while a render runs"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stop_event = threading.Event()
+        self.peak_rss = 0
+        self.peak_ffmpeg = 0
+        self.peak_busy_workers = 0
+
+    def run(self):
+        ffmpeg = os.fsencode(get_setting("FFMPEG_BINARY"))
+        me = os.getpid()
+        while not self.stop_event.is_set():
+            self.peak_rss = max(self.peak_rss, resident_bytes())
+            parents = process_tree()
+            below = {me}
+            for _ in range(3):
+                below |= {pid for pid, parent in parents.items() if parent in below}
+            encoders = [pid for pid in below - {me} if command_line(pid)[:1] == [ffmpeg]]
+            self.peak_ffmpeg = max(self.peak_ffmpeg, len(encoders))
+            # ffmpeg processes started by pool workers rather than by this process
+            busy = {parents[pid] for pid in encoders if parents.get(pid) != me}
+            self.peak_busy_workers = max(self.peak_busy_workers, len(busy))
+            self.stop_event.wait(0.005)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop_event.set()
+        self.join()
+
+
+@pytest.fixture
+def long_dataset(make_dataset):
+    # Alphabetic glosses, each a separate file so every sign is a cache miss
+    glosses = [f"x{a}{b}" for a, b in itertools.product(string.ascii_lowercase, repeat=2)][:6 * SIGNS]
+    return glosses, make_dataset(glosses)
+
+
+def measure(render, glosses, count, tmp_path):
+    output_path = str(tmp_path / f"out_{count}.mp4")
+    with ResourceSampler() as sampler:
+        assert render(' '.join(glosses[:count]), output_path) == output_path
+    return sampler
+
+
+def test_segmented_render_bounds_read_ahead(tmp_path, long_dataset, segment_cache, offline_gloss):
+    glosses, videos_path = long_dataset
+    profile = get_profile('interactive')
+
+    def render(text, output_path):
+        return text_to_sign(text, glosses, videos_path, output_path, profile=profile)
+
+    short = measure(render, glosses, SIGNS, tmp_path)
+    long = measure(render, glosses, 6 * SIGNS, tmp_path)
+
+    for sampler in (short, long):
+        assert sampler.peak_busy_workers <= sign_render.READ_AHEAD
+        # Two per preparing worker, plus one encode or join on the render thread
+        assert sampler.peak_ffmpeg <= 2 * sign_render.READ_AHEAD + 2
+    assert long.peak_rss - short.peak_rss < RSS_GROWTH_LIMIT
+
+
+def test_streaming_render_holds_one_clip_open(tmp_path, long_dataset, offline_gloss):
+    glosses, videos_path = long_dataset
+    profile = get_profile('interactive')
+
+    def render(text, output_path):
+        return stream_text_to_sign(text, glosses, videos_path, output_path, profile=profile)
+
+    short = measure(render, glosses, SIGNS, tmp_path)
+    long = measure(render, glosses, 6 * SIGNS, tmp_path)
+
+    for sampler in (short, long):
+        # One decoder feeding one encoder
+        assert sampler.peak_ffmpeg <= 2
+        assert sampler.peak_busy_workers == 0
+    assert long.peak_rss - short.peak_rss < RSS_GROWTH_LIMIT
@@ -0,0 +1,115 @@
+# Standard library imports
+import json
+import os
+import threading
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+
+# Third-party imports
+import pytest
+
+from ui.render_service import RenderRequestHandler, RenderService
+
+
+@pytest.fixture
+def server(tmp_path, make_dataset, segment_cache, offline_gloss):
+    service = RenderService(str(tmp_path / "renders"), make_dataset(["hello", "world"]), workers=1)
+    handler = type("Handler", (RenderRequestHandler,), {'service': service})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd, service
+    httpd.shutdown()
+    httpd.server_close()
+    service.shutdown()
+
+
+def post(httpd, body):
+    connection = HTTPConnection(*httpd.server_address, timeout=10)
+    payload = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+    connection.request('POST', '/jobs', body=payload, headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+    return result
+
+
+@pytest.mark.parametrize("body", [
+    ["hello"],
+    "hello",
+    {'texts': "hello"},
+    {'texts': []},
+    {'texts': ["hello", ""]},
+    {'texts': ["hello", 3]},
+    {'text': "   "},
+    {'text': ["hello"]},
+    {},
+])
+def test_malformed_requests_are_rejected(server, body):
+    httpd, service = server
+    status, payload = post(httpd, body)
+    assert status == 400
+    assert 'error' in payload
+    assert service.stats()['submitted'] == 0
+
+
+def test_invalid_json_is_rejected(server):
+    httpd, _ = server
+    assert post(httpd, b'{"texts": [')[0] == 400
+
+
+def test_texts_are_queued_one_job_each(server):
+    httpd, service = server
+    status, payload = post(httpd, {'texts': ["hello", "hello world"]})
+    assert status == 202
+    assert [job['text'] for job in payload['jobs']] == ["hello", "hello world"]
+
+    service.wait([service.get(job['id']) for job in payload['jobs']])
+    assert [service.describe(service.get(job['id']))['status'] for job in payload['jobs']] == ['done', 'done']
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_failed_jobs_report_the_cause(tmp_path, make_dataset, segment_cache, offline_gloss, streaming):
+    dataset_path = make_dataset(["hello"])
+    (tmp_path / "dataset" / "broken.mp4").write_bytes(b"not a video")
+    service = RenderService(str(tmp_path / "renders"), dataset_path, workers=1, streaming=streaming)
+    try:
+        job = service.submit("hello broken")
+        service.wait([job])
+    finally:
+        service.shutdown()
+
+    info = service.describe(job)
+    assert info['status'] == 'failed'
+    assert "ffmpeg failed to decode" in info['error'] and "broken.mp4" in info['error']
+    # Nothing partial is left behind
+    assert os.listdir(service.cache_dir) == []
+
+
+def get(httpd, path):
+    connection = HTTPConnection(*httpd.server_address, timeout=10)
+    connection.request('GET', path)
+    response = connection.getresponse()
+    result = response.status, response.read()
+    connection.close()
+    return result
+
+
+def test_removed_video_is_gone_and_rendered_again(server):
+    httpd, service = server
+    _, payload = post(httpd, {'text': "hello"})
+    job = service.get(payload['jobs'][0]['id'])
+    service.wait([job])
+    assert get(httpd, f"/jobs/{job.id}/video")[0] == 200
+
+    os.remove(job.output_path)
+    status, body = get(httpd, f"/jobs/{job.id}/video")
+    assert status == 410
+    assert 'error' in json.loads(body)
+
+    # Submitting the text again renders it again
+    _, payload = post(httpd, {'text': "hello"})
+    again = service.get(payload['jobs'][0]['id'])
+    assert again is not job
+    service.wait([again])
+    assert get(httpd, f"/jobs/{job.id}/video")[0] == 200
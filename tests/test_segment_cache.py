@@ -0,0 +1,72 @@
+# Standard library imports
+import os
+import threading
+import time
+
+# Third-party imports
+import pytest
+
+from ui import segment_cache, transitions
+from ui.segment_cache import SegmentCache
+from ui.sign_render import text_to_sign
+
+
+def cache_file(cache, name, age):
+    path = os.path.join(cache.root, "profile", f"{name}.mp4")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(b'x' * 100)
+    used = time.time() - age
+    os.utime(path, (used, used))
+    return path
+
+
+def test_prune_keeps_pinned_and_recent_segments(tmp_path):
+    cache = SegmentCache(str(tmp_path), max_bytes=0, min_age=60)
+    old = cache_file(cache, "old", 600)
+    held = cache_file(cache, "held", 600)
+    recent = cache_file(cache, "recent", 10)
+
+    cache.pin([held])
+    cache.prune()
+    assert not os.path.exists(old)
+    assert os.path.exists(held)
+    assert os.path.exists(recent)
+
+    cache.unpin([held])
+    cache.prune()
+    assert not os.path.exists(held)
+
+
+@pytest.fixture
+def tiny_cache(tmp_path, monkeypatch):
+    """A cache that wants every segment gone as soon as nothing holds it"""
+    cache = SegmentCache(str(tmp_path / "segments"), max_bytes=0, min_age=0)
+    monkeypatch.setattr(segment_cache, "_cache", cache)
+    monkeypatch.setattr(transitions, "_library", None)
+    return cache
+
+
+def test_render_joins_before_pruning(tmp_path, make_dataset, tiny_cache, offline_gloss):
+    videos_path = make_dataset(["hello", "world"])
+    output_path = str(tmp_path / "out.mp4")
+    assert text_to_sign("hello world", ["hello", "world"], videos_path, output_path) == output_path
+
+
+def test_concurrent_renders_keep_each_others_segments(tmp_path, make_dataset, tiny_cache, offline_gloss):
+    glosses = ["hello", "world", "good", "morning"]
+    videos_path = make_dataset(glosses)
+    texts = ["hello world", "world hello", "good morning hello", "morning good world"] * 2
+    results = [None] * len(texts)
+
+    def render(index):
+        output_path = str(tmp_path / f"out_{index}.mp4")
+        results[index] = text_to_sign(texts[index], glosses, videos_path, output_path) == output_path
+
+    threads = [threading.Thread(target=render, args=(index,)) for index in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(results)
+    assert tiny_cache._pins == {}
@@ -0,0 +1,49 @@
+# Standard library imports
+import os
+import string
+
+# Third-party imports
+import pytest
+
+from ui.sign_render import (
+    build_sequence, load_timing, render_speed_variant, segment_duration, speed_variant_path, text_to_sign
+)
+
+# Like the real dataset, which has a clip for every letter and digit
+GLOSSES = list(string.ascii_lowercase) + list(string.digits)
+
+
+def test_multi_digit_numbers_use_dataset_clips(make_dataset, offline_gloss):
+    videos_path = make_dataset(GLOSSES)
+
+    sequence = build_sequence("123", GLOSSES, videos_path)
+    assert [(kind, gloss) for kind, _, gloss, _ in sequence] == [('clip', '1'), ('clip', '2'), ('clip', '3')]
+    assert all(span == (0, 3) for _, _, _, span in sequence)
+
+    sequence = build_sequence("covid19", GLOSSES, videos_path)
+    assert [(kind, gloss) for kind, _, gloss, _ in sequence] == [('spell', 'covid'), ('clip', '1'), ('clip', '9')]
+
+
+def test_multi_digit_numbers_are_rendered(tmp_path, make_dataset, segment_cache, offline_gloss):
+    videos_path = make_dataset(GLOSSES)
+    output_path = str(tmp_path / "out.mp4")
+
+    assert text_to_sign("123", GLOSSES, videos_path, output_path) == output_path
+    timing = load_timing(output_path)
+    assert [entry['gloss'] for entry in timing['entries']] == ['1', '2', '3']
+    assert not any(entry['fingerspelled'] for entry in timing['entries'])
+
+
+@pytest.mark.parametrize("speed", [0.5, 2.0])
+def test_speed_variants_of_a_playlist(tmp_path, make_dataset, segment_cache, offline_gloss, speed):
+    videos_path = make_dataset(GLOSSES)
+    playlist_path = str(tmp_path / "render" / "playlist.m3u8")
+    assert text_to_sign("1 2 3", GLOSSES, videos_path, playlist_path=playlist_path) == playlist_path
+    original = load_timing(playlist_path)['entries'][-1]['end']
+
+    variant_path = render_speed_variant(playlist_path, speed)
+    assert variant_path == speed_variant_path(playlist_path, speed)
+    assert os.path.exists(variant_path)
+    assert segment_duration(variant_path) == pytest.approx(original / speed, rel=0.05)
+    timing = load_timing(variant_path)
+    assert timing['entries'][-1]['end'] == pytest.approx(original / speed, abs=0.01)
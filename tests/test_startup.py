@@ -0,0 +1,30 @@
+# Standard library imports
+import importlib
+import socket
+import sys
+
+# Third-party imports
+import nltk
+
+
+def test_importing_tts_stays_offline(monkeypatch):
+    """Opening the app must not reach the network or fetch NLTK data"""
+    connections = []
+    downloads = []
+
+    class BlockedSocket(socket.socket):
+        def __init__(self, *args, **kwargs):
+            connections.append(args)
+            raise OSError("network access at import time")
+
+    monkeypatch.setattr(socket, "socket", BlockedSocket)
+    monkeypatch.setattr(nltk, "download", lambda *args, **kwargs: downloads.append(args) or False)
+    for name in ("ui.TTS", "ui.sign_render", "ui.gloss"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    importlib.import_module("ui.TTS")
+    gloss = importlib.import_module("ui.gloss")
+
+    assert connections == []
+    assert downloads == []
+    assert gloss._nltk_ready is None
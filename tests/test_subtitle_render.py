@@ -0,0 +1,30 @@
+# Third-party imports
+import pytest
+
+from ui import subtitle_render
+from ui.render_profiles import get_profile
+from ui.sign_render import segment_duration
+from ui.subtitle_render import Cue, CueResult, assemble_track
+
+
+def test_cues_starting_after_their_slot_are_overruns(tmp_path, synthetic_clip):
+    # Every clip is 0.5 s, far longer than the 0.1 s between cues
+    results = [CueResult(Cue(start, start + 0.1, "hello"), synthetic_clip, 1, 0) for start in (0.0, 0.1, 0.2)]
+    profile = get_profile('mobile')
+    output_path = str(tmp_path / "track.mp4")
+
+    # The first cue overruns its slot; the second starts after its slot has passed
+    assert assemble_track(results, output_path, profile, max_speedup=1.5) == 2
+    # Both are compressed, so only the last cue plays at full length
+    assert segment_duration(output_path) == pytest.approx(0.5 / 1.5 * 2 + 0.5, abs=0.1)
+
+
+def test_failed_cues_fail_the_run(tmp_path, make_dataset, segment_cache, offline_gloss):
+    videos_path = make_dataset(["hello"])
+    subtitles = tmp_path / "lecture.srt"
+    subtitles.write_text("1\n00:00:00,000 --> 00:00:01,000\nhello\n\n"
+                         "2\n00:00:02,000 --> 00:00:03,000\n...\n", encoding='utf-8')
+    output_path = str(tmp_path / "lecture.sign.mp4")
+
+    assert subtitle_render.main([str(subtitles), '-o', output_path, '--dataset', videos_path,
+                                 '--profile', 'mobile']) == 1
@@ -0,0 +1,109 @@
+# Standard library imports
+import os
+
+# Third-party imports
+import pytest
+
+
+@pytest.fixture
+def tts(qapp, tmp_path, monkeypatch):
+    # The loading spinner writes its picture relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    from ui.TTS import TTS
+
+    widget = TTS()
+    yield widget
+    widget.deleteLater()
+
+
+def fake_playlist(directory):
+    """A playlist directory as a render leaves it part way through"""
+    os.makedirs(directory)
+    for name in ("playlist.m3u8", "playlist.timing.json", "segment_0.ts", "segment_1.ts.part"):
+        with open(os.path.join(directory, name), 'w') as file:
+            file.write("x")
+    return os.path.join(directory, "playlist.m3u8")
+
+
+def test_cancelled_render_is_removed_once_its_worker_stops(tts, tmp_path):
+    from ui.TTS import RenderWorker
+
+    worker = RenderWorker(1, "hello", [], str(tmp_path), tts.render_profile)
+    worker.output_path = fake_playlist(str(tmp_path / "render_1"))
+    tts.render_job_id = 1
+    tts.current_worker = worker
+    tts.current_output = worker.output_path  # Already streaming its first segments
+
+    tts.cancel_render()
+    assert worker.is_cancelled()
+    # Nothing is deleted while the worker may still be writing
+    assert os.path.isdir(tmp_path / "render_1")
+
+    tts.on_render_cancelled(1)
+    assert not os.path.exists(tmp_path / "render_1")
+    assert tts.current_output is None
+    assert tts.cancelled_outputs == {}
+
+
+def test_render_finishing_after_cancel_is_discarded(tts, tmp_path):
+    from ui.TTS import RenderWorker
+
+    worker = RenderWorker(1, "hello", [], str(tmp_path), tts.render_profile)
+    worker.output_path = fake_playlist(str(tmp_path / "render_1"))
+    tts.render_job_id = 2
+    tts.current_worker = worker
+
+    tts.cancel_render()
+    tts.on_render_finished(1, worker.output_path)
+    assert not os.path.exists(tmp_path / "render_1")
+
+
+def test_finished_playback_leaves_no_video_to_retime(tts, tmp_path, monkeypatch):
+    from PySide6.QtMultimedia import QMediaPlayer
+    from ui import TTS
+
+    started = []
+    monkeypatch.setattr(TTS.SpeedVariantWorker, "run", lambda worker: started.append(worker.speed))
+    output_path = fake_playlist(str(tmp_path / "render_1"))
+    tts.play_output(output_path)
+    tts.speed_variants = {0.5: str(tmp_path / "render_1" / "playlist.speed0.5.mp4")}
+    tts.pending_variants = {2.0}
+
+    tts.media_player.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+    assert not os.path.exists(tmp_path / "render_1")
+    assert tts.current_output is None
+    assert tts.speed_variants == {} and tts.pending_variants == set()
+
+    # A later slider move has nothing to re-time
+    tts.speed_slider.setValue(50)
+    tts.apply_speed_variant()
+    tts.variant_pool.waitForDone()
+    assert started == []
+
+
+def test_missing_video_is_not_retimed(tts, tmp_path, monkeypatch):
+    from ui import TTS
+
+    started = []
+    monkeypatch.setattr(TTS.SpeedVariantWorker, "run", lambda worker: started.append(worker.speed))
+    tts.current_output = str(tmp_path / "gone" / "playlist.m3u8")
+
+    tts.speed_slider.setValue(50)
+    tts.apply_speed_variant()
+    tts.variant_pool.waitForDone()
+    assert started == []
+
+
+def test_status_handler_follows_the_current_video(tts, tmp_path, monkeypatch):
+    from PySide6.QtMultimedia import QMediaPlayer
+    from ui import TTS
+
+    calls = []
+    monkeypatch.setattr(TTS, "remove_render_output", calls.append)
+    for i in range(1000):
+        tts.play_output(str(tmp_path / f"render_{i}" / "playlist.m3u8"))
+
+    # One handler, acting on the video playing now
+    tts.media_player.mediaStatusChanged.emit(QMediaPlayer.MediaStatus.EndOfMedia)
+    assert calls == [str(tmp_path / "render_999" / "playlist.m3u8")]
+    assert tts.current_output is None
@@ -0,0 +1,52 @@
+# Standard library imports
+import os
+
+# Third-party imports
+import pytest
+
+from ui import video_previews
+
+LFS_POINTER = b"version https://git-lfs.github.com/spec/v1\noid sha256:0\nsize 1\n"
+
+
+@pytest.fixture
+def clips(tmp_path, synthetic_clip, monkeypatch):
+    monkeypatch.setattr(video_previews, "PREVIEW_CACHE_DIR", str(tmp_path / "previews"))
+    attempts = []
+    build_previews = video_previews.build_previews
+
+    def counting_build(path):
+        attempts.append(os.path.basename(path))
+        return build_previews(path)
+
+    monkeypatch.setattr(video_previews, "build_previews", counting_build)
+    broken = tmp_path / "pointer.mp4"
+    broken.write_bytes(LFS_POINTER)
+    return [synthetic_clip, str(broken)], attempts
+
+
+def test_failed_clips_are_skipped_until_they_change(clips, capsys):
+    paths, attempts = clips
+    assert video_previews.index_clips(paths, workers=1) == (1, 1)
+    assert "pointer.mp4" in capsys.readouterr().out
+
+    # The next start does not run ffmpeg on the pointer or warn about it again
+    attempts.clear()
+    assert video_previews.index_clips(paths, workers=1) == (1, 1)
+    assert attempts == ["testsrc.mp4"]
+    assert capsys.readouterr().out == ""
+
+    # Once the real clip is fetched it is indexed
+    attempts.clear()
+    with open(paths[1], 'wb') as replacement, open(paths[0], 'rb') as clip:
+        replacement.write(clip.read())
+    assert video_previews.index_clips(paths, workers=1) == (2, 0)
+    assert attempts == ["testsrc.mp4", "pointer.mp4"]
+
+
+def test_retry_failed_tries_again(clips):
+    paths, attempts = clips
+    video_previews.index_clips(paths, workers=1)
+    attempts.clear()
+    assert video_previews.index_clips(paths, workers=1, retry_failed=True) == (1, 1)
+    assert attempts == ["testsrc.mp4", "pointer.mp4"]
@@ -7,6 +7,7 @@ from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from ui.STT import STT
 from ui.TTS import TTS
+from ui.image_cache import load_pixmap
 import subprocess
 import sys
 
@@ -89,9 +90,9 @@ class Home(QMainWindow):
         layout.addWidget(title_label)
 
         image_label = QLabel()
-        pixmap = QPixmap(image_path)
+        pixmap = load_pixmap(image_path, 300, 200)
         if not pixmap.isNull():
-            image_label.setPixmap(pixmap.scaled(300, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            image_label.setPixmap(pixmap)
         image_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(image_label)
 
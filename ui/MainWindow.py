@@ -1,12 +1,13 @@
 import sys
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QStackedWidget, QLabel, QProgressBar, QFrame, QHBoxLayout, QApplication, QPushButton
-from PySide6.QtCore import Qt, QSize, Signal, Slot
+from PySide6.QtCore import Qt, QSize, Signal, Slot, QObject
 from PySide6.QtGui import QFont, QPixmap, QIcon
 from ui.Home import Home 
 from ui.STT import STT
 from ui.TTS import TTS
 from ui.lesson_ui import QuizUI
 from ui.learning import LearningSection
+from ui.image_cache import load_pixmap
 
 class MainWindow(QWidget):
     def __init__(self):
@@ -59,7 +60,7 @@ class MainWindow(QWidget):
         # Logo
         logo = QLabel()
         logo.setAlignment(Qt.AlignCenter)
-        logo.setPixmap(QPixmap("assets/logo.png").scaled(100, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo.setPixmap(load_pixmap("assets/logo.png", 100, 50))
         logo.setStyleSheet("margin:15px 10px")
         sidebar_layout.addWidget(logo)
         
@@ -73,6 +74,7 @@ class MainWindow(QWidget):
         ]
         
         self.nav_button_dict = {}
+        self.nav_connections = {}
         
         # Active and inactive styles
         self.active_style = """
@@ -122,7 +124,7 @@ class MainWindow(QWidget):
             self.nav_button_dict[text] = button
             
             # Connect button directly with its index
-            button.clicked.connect(lambda checked=False, idx=index: self.switch_tab(idx))
+            self.nav_connections[text] = button.clicked.connect(lambda checked=False, idx=index: self.switch_tab(idx))
             
             sidebar_layout.addWidget(button)
         
@@ -154,16 +156,15 @@ class MainWindow(QWidget):
         Update navigation bar connections when switching between sections.
         This ensures the navigation bar works correctly in all learning modes.
         """
-        # Disconnect all existing connections
-        for text, button in self.nav_button_dict.items():
-            try:
-                button.clicked.disconnect()
-            except RuntimeError:
-                pass  # If not connected, ignore error
+        # Disconnect all existing connections. Disconnecting by connection
+        # handle rather than clicked.disconnect(), which corrupts the
+        # refcount of the bool it returns and crashes after enough calls.
+        for connection in self.nav_connections.values():
+            QObject.disconnect(connection)
         
         # Reconnect all buttons properly
         for index, text in enumerate(self.nav_button_dict.keys()):
-            self.nav_button_dict[text].clicked.connect(
+            self.nav_connections[text] = self.nav_button_dict[text].clicked.connect(
                 lambda checked=False, idx=index: self.switch_tab(idx)
             )
         
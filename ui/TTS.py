@@ -1,186 +1,118 @@
 # Standard library imports
+import logging
 import sys
 import os
 import re
 import subprocess
-from typing import List, Optional
+import tempfile
+import threading
+from typing import List
 
 # Third-party imports
 import cv2
-import nltk
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
-from nltk.corpus import wordnet
-from moviepy.editor import VideoFileClip, concatenate_videoclips, ColorClip
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QButtonGroup, QTextEdit,
     QGraphicsDropShadowEffect, QSlider, QDialog
 )
-from PySide6.QtCore import Qt, QUrl, QTimer, Signal
-from PySide6.QtGui import QFont, QPixmap, QColor, QTextCursor, QKeySequence
+from PySide6.QtCore import Qt, QUrl, QTimer, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QFont, QPixmap, QColor, QTextCursor, QKeySequence, QTextCharFormat
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
+from ui.loading_spinner import LoadingSpinner
+from ui.render_profiles import RenderProfile, get_profile
+from ui.sign_render import (
+    text_to_sign, load_dataset, load_timing, remove_render_output, render_speed_variant, speed_bucket,
+    RenderCancelled, DATASET_PATH
+)
 
+logger = logging.getLogger(__name__)
 
-# Initialize NLTK components
-nltk.download('punkt')
-nltk.download('wordnet')
-nltk.download('averaged_perceptron_tagger')
-
-# Helper functions
-def get_wordnet_pos(tag):
-    if tag.startswith('J'):
-        return wordnet.ADJ
-    elif tag.startswith('V'):
-        return wordnet.VERB
-    elif tag.startswith('N'):
-        return wordnet.NOUN
-    elif tag.startswith('R'):
-        return wordnet.ADV
-    else:
-        return wordnet.NOUN
-
-def parse_string(string, dataset):
-    dataset_lower = [d.lower() for d in dataset]
-    case_mapping = dict(zip(dataset_lower, dataset))
-    
-    # Identify sentence type
-    sentence_type = 'statement'
-    if '?' in string:
-        sentence_type = 'question'
-    elif '!' in string:
-        sentence_type = 'exclamation'
-    
-    # Clean and normalize input
-    string = string.lower().strip()
-    
-    # Split into words and process each word
-    words = string.split()
-    result = []
-    i = 0
-    
-    # Add sentence type indicator
-    if sentence_type == 'question' and 'question' in dataset_lower:
-        result.append(case_mapping['question'])
-    elif sentence_type == 'exclamation' and 'exclamation' in dataset_lower:
-        result.append(case_mapping['exclamation'])
-    
-    while i < len(words):
-        # Check if the word is a number
-        if words[i].isdigit() and int(words[i]) < 10:
-            result.append(words[i])  # Directly use the number for video filename
-            i += 1
-            continue
-            
-        # Try matching phrases
-        phrase_found = False
-        for j in range(len(words), i, -1):
-            phrase = ' '.join(words[i:j])
-            clean_phrase = phrase.replace('?', '').replace('!', '')
-            if clean_phrase in dataset_lower:
-                result.append(case_mapping[clean_phrase])
-                i = j
-                phrase_found = True
-                break
-        
-        if not phrase_found:
-            # Handle individual words or letters
-            word = words[i].replace('?', '').replace('!', '')
-            if word in dataset_lower:
-                result.append(case_mapping[word])
-            else:
-                # Break into individual letters
-                for letter in word:
-                    if letter in dataset_lower:
-                        result.append(case_mapping[letter])
-            i += 1
-    
-    return result
 
-def remove_empty_values(lst):
-    return [x for x in lst if x]
+class RenderSignals(QObject):
+    """Signals emitted by RenderWorker, tagged with the job id"""
+    progress = Signal(int, int, str)
+    segment_ready = Signal(int, str)
+    finished = Signal(int, object)
+    cancelled = Signal(int)
 
-def flatten_lists(lst):
-    flat_list = []
-    for i in lst:
-        if isinstance(i, list):
-            flat_list.extend(flatten_lists(i))
-        else:
-            flat_list.append(i)
-    return flat_list
 
-def text_to_sign(text: str, dataset: List[str], videos_path: str) -> Optional[str]:
-    output_path = "combined.avi"
-    standard_size = (640, 480)
-    clips = []
-    
-    try:
-        if os.path.exists(output_path):
-            os.remove(output_path)
-            
-        text = text.lower().strip()
-        text = re.sub('[^a-z0-9\s]+', ' ', text)
-        words = parse_string(text, dataset)
-        words = remove_empty_values(words)
-        words = flatten_lists(words)
-        
-        for i, word in enumerate(words):
-            # Try different filename formats
-            possible_filenames = [
-                f"{word}.mp4",
-                f"{word.replace(' ', '-')}.mp4",
-                f"{word.replace(' ', '')}.mp4"
-            ]
-            
-            video_path = None
-            for filename in possible_filenames:
-                temp_path = os.path.join(videos_path, filename)
-                if os.path.exists(temp_path):
-                    video_path = temp_path
-                    break
-            
-            if not video_path:
-                print(f"Warning: Video for '{word}' not found")
-                continue
-                
-            clip = VideoFileClip(video_path)
-            clips.append(clip.resize(standard_size))
-            
-            if i < len(words) - 1:
-                space_clip = ColorClip(
-                    size=standard_size,
-                    color=(255, 255, 255),
-                    duration=0.3
-                ).set_opacity(0.0)
-                clips.append(space_clip)
-                
-        if not clips:
-            return None
-            
-        final_clip = concatenate_videoclips(clips, method='compose')
-        final_clip.write_videofile(
-            output_path,
-            fps=30,
-            codec='libx264',
-            preset='medium',
-            ffmpeg_params=['-crf', '23']
+class RenderWorker(QRunnable):
+    """Runs text_to_sign off the GUI thread so the window stays responsive"""
+
+    def __init__(self, job_id: int, text: str, dataset: List[str], videos_path: str, profile: RenderProfile):
+        super().__init__()
+        self.job_id = job_id
+        self.text = text
+        self.dataset = dataset
+        self.videos_path = videos_path
+        self.profile = profile
+        # Rendered as an HLS playlist so playback can start with the first word
+        self.output_path = os.path.join(
+            tempfile.gettempdir(), f"text_to_sign_{os.getpid()}_{job_id}", "playlist.m3u8"
         )
-        
-        return output_path
-        
-    except Exception as e:
-        print(f"Error processing video: {str(e)}")
-        return None
-        
-    finally:
-        for clip in clips:
-            clip.close()
-        if 'final_clip' in locals():
-            final_clip.close()
+        self.signals = RenderSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def on_segment(self, playlist_path: str, index: int):
+        if index == 0 and not self.is_cancelled():
+            self.signals.segment_ready.emit(self.job_id, playlist_path)
+
+    def run(self):
+        try:
+            output_path = text_to_sign(
+                self.text, self.dataset, self.videos_path,
+                playlist_path=self.output_path,
+                progress_callback=lambda percent, message: self.signals.progress.emit(self.job_id, percent, message),
+                cancel_check=self.is_cancelled,
+                segment_callback=self.on_segment,
+                profile=self.profile
+            )
+        except RenderCancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+        except Exception as e:
+            print(f"Error in video processing: {str(e)}")
+            output_path = None
+
+        if self.is_cancelled():
+            if output_path:
+                remove_render_output(output_path)
+            self.signals.cancelled.emit(self.job_id)
+        else:
+            self.signals.finished.emit(self.job_id, output_path)
+
+class SpeedVariantSignals(QObject):
+    finished = Signal(str, float, object)
+
+
+class SpeedVariantWorker(QRunnable):
+    """Pre-renders a playback speed variant of a finished video"""
+
+    def __init__(self, video_path: str, speed: float, profile: RenderProfile):
+        super().__init__()
+        self.video_path = video_path
+        self.speed = speed
+        self.profile = profile
+        self.signals = SpeedVariantSignals()
+
+    def run(self):
+        try:
+            output_path = render_speed_variant(self.video_path, self.speed, self.profile)
+        except Exception:
+            logger.exception("Error rendering %gx variant of %s", self.speed, self.video_path)
+            output_path = None
+        self.signals.finished.emit(self.video_path, self.speed, output_path)
 
 class LimitedTextEdit(QTextEdit):
     textLengthChanged = Signal(int)
+    positionActivated = Signal(int)
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -222,6 +154,25 @@ class LimitedTextEdit(QTextEdit):
             
         super().keyPressEvent(event)
 
+    def mouseDoubleClickEvent(self, event):
+        super().mouseDoubleClickEvent(event)
+        self.positionActivated.emit(self.cursorForPosition(event.position().toPoint()).position())
+
+    def highlight_range(self, start: int, end: int):
+        """Mark a span of the text without changing the document or the cursor"""
+        text_format = QTextCharFormat()
+        text_format.setBackground(QColor("#fff59d"))
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(min(start, len(self.toPlainText())))
+        cursor.setPosition(min(end, len(self.toPlainText())), QTextCursor.KeepAnchor)
+        selection = QTextEdit.ExtraSelection()
+        selection.cursor = cursor
+        selection.format = text_format
+        self.setExtraSelections([selection])
+
+    def clear_highlight(self):
+        self.setExtraSelections([])
+
 class TTS(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -236,6 +187,34 @@ class TTS(QMainWindow):
         # Add this line for processing state
         self.is_processing = False
 
+        # Background rendering: one render at a time, newer sends cancel older ones
+        self.render_pool = QThreadPool(self)
+        self.render_pool.setMaxThreadCount(1)
+        self.render_job_id = 0
+        self.current_worker = None
+        self.streaming_job_id = None
+        self.current_output = None
+        # Outputs of cancelled renders by job id, removed once their worker stops
+        self.cancelled_outputs = {}
+
+        # Speed variants of the current video, keyed by speed bucket. The
+        # player only applies the residual rate on top of the loaded variant.
+        self.variant_pool = QThreadPool(self)
+        self.variant_pool.setMaxThreadCount(1)
+        self.speed_variants = {}
+        self.pending_variants = set()
+        self.playing_speed = 1.0
+        self.pending_seek = None
+        self.speed_timer = QTimer(self)
+        self.speed_timer.setSingleShot(True)
+        self.speed_timer.setInterval(300)
+        self.speed_timer.timeout.connect(self.apply_speed_variant)
+
+        # Timing track of the current video, used to follow along in the text
+        self.timing = None
+        self.rendered_text = None
+        self.text_offset = 0
+
         self.audio_output = QAudioOutput()
         self.media_player = QMediaPlayer()
 
@@ -246,12 +225,16 @@ class TTS(QMainWindow):
             border-radius: 12px;
             border: 2px solid #eef2f7;
         """)
+        # Connected once: handle_media_status acts on whatever current_output is
         self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        self.media_player.positionChanged.connect(self.update_word_highlight)
         
         # Initialize dataset
-        self.dataset_path = "text-to-sign/Dataset/simplified_dataset"
-        self.videos = os.listdir(self.dataset_path)
-        self.video_names = [os.path.splitext(video)[0].replace('-', ' ').lower() for video in self.videos]
+        self.dataset_path = DATASET_PATH
+        self.video_names = load_dataset(self.dataset_path)
+
+        # Favour turnaround over quality for on-screen previews
+        self.render_profile = get_profile('interactive')
         
         # Modern color palette
         self.colors = {
@@ -315,6 +298,8 @@ class TTS(QMainWindow):
 
         self.setup_ui()
 
+        self.loading_spinner = LoadingSpinner(self)
+
     def setup_ui(self):
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -394,6 +379,8 @@ class TTS(QMainWindow):
         """)
         self.char_counter.setAlignment(Qt.AlignRight)
         self.text_input.textLengthChanged.connect(self.update_char_counter)
+        self.text_input.positionActivated.connect(self.seek_to_word)
+        self.text_input.setToolTip("Double-click a word to jump to its sign")
 
         # Right Frame Setup
         right_frame = QFrame()
@@ -674,17 +661,63 @@ class TTS(QMainWindow):
     def update_speed(self):
         speed = self.speed_slider.value() / 100.0
         self.speed_label.setText(f"⚡ {speed:.2f}x")
-        self.media_player.setPlaybackRate(speed)
-
-    def handle_media_status(self, status, output_path):
-        """Handle media player state changes"""
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            # Clean up temporary video file when playback finishes
-            try:
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-            except:
-                pass
+        self.media_player.setPlaybackRate(speed / self.playing_speed)
+        # Wait for the slider to settle before switching variants
+        self.speed_timer.start()
+
+    def apply_speed_variant(self):
+        """Play the pre-rendered variant for the slider's speed bucket, rendering it if needed"""
+        if not self.current_output or not os.path.exists(self.current_output) or self.is_processing:
+            return
+        bucket = speed_bucket(self.speed_slider.value() / 100.0)
+        if bucket == self.playing_speed:
+            return
+        path = self.current_output if bucket == 1.0 else self.speed_variants.get(bucket)
+        if path:
+            self.switch_source(path, bucket)
+        elif bucket not in self.pending_variants:
+            self.pending_variants.add(bucket)
+            worker = SpeedVariantWorker(self.current_output, bucket, self.render_profile)
+            worker.signals.finished.connect(self.on_speed_variant_ready)
+            self.variant_pool.start(worker)
+
+    def on_speed_variant_ready(self, video_path: str, speed: float, variant_path):
+        if video_path != self.current_output:
+            # The video it was made for has been replaced or deleted
+            if variant_path:
+                remove_render_output(variant_path)
+            return
+        self.pending_variants.discard(speed)
+        if variant_path:
+            self.speed_variants[speed] = variant_path
+            self.apply_speed_variant()
+
+    def switch_source(self, path: str, speed: float):
+        """Swap in another speed variant, keeping the point reached in the sentence"""
+        was_playing = self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+        self.pending_seek = int(self.media_player.position() * self.playing_speed / speed)
+        self.playing_speed = speed
+        self.media_player.setSource(QUrl.fromLocalFile(os.path.abspath(path)))
+        self.media_player.setPlaybackRate(self.speed_slider.value() / 100.0 / speed)
+        if was_playing:
+            self.media_player.play()
+
+    def handle_media_status(self, status):
+        """Handle media player state changes for the current video"""
+        output_path = self.current_output
+        if status == QMediaPlayer.MediaStatus.LoadedMedia and self.pending_seek is not None:
+            self.media_player.setPosition(self.pending_seek)
+            self.pending_seek = None
+        elif status == QMediaPlayer.MediaStatus.EndOfMedia:
+            # Clean up temporary video file when playback finishes, unless
+            # playback caught up with a render that is still running
+            if output_path and not self.is_processing:
+                remove_render_output(output_path)
+                self.current_output = None
+                self.speed_timer.stop()
+                self.reset_speed_variants()
+                self.timing = None
+                self.text_input.clear_highlight()
         elif status == QMediaPlayer.MediaStatus.InvalidMedia:
             self.show_error("Invalid video generated")
 
@@ -695,10 +728,8 @@ class TTS(QMainWindow):
         return bool(re.fullmatch(pattern, text))
 
     def send_text(self):
-        if self.is_processing:
-            return
-            
-        text = self.text_input.toPlainText().strip()
+        raw_text = self.text_input.toPlainText()
+        text = raw_text.strip()
         
         # Validate input
         if not text:
@@ -713,14 +744,53 @@ class TTS(QMainWindow):
             self.show_error("Input exceeds maximum length of 200 characters")
             return
         
+        # A new send supersedes any render still in flight
+        self.cancel_render()
         self.is_processing = True
         
-        # Stop current playback
+        # Stop current playback and drop the previous video
         self.media_player.stop()
-        self.media_player.setSource("")
+        self.media_player.setSource(QUrl())
+        if self.current_output and self.current_output not in self.cancelled_outputs.values():
+            remove_render_output(self.current_output)
+        self.current_output = None
+
+        # Word spans in the timing track are relative to the stripped text
+        self.timing = None
+        self.rendered_text = raw_text
+        self.text_offset = len(raw_text) - len(raw_text.lstrip())
+        self.text_input.clear_highlight()
         
-        # Process in background
-        QTimer.singleShot(0, self._process_text)
+        # Render in the background and report progress through the spinner
+        self.render_job_id += 1
+        worker = RenderWorker(self.render_job_id, text, self.video_names, self.dataset_path, self.render_profile)
+        worker.signals.progress.connect(self.on_render_progress)
+        worker.signals.segment_ready.connect(self.on_segment_ready)
+        worker.signals.finished.connect(self.on_render_finished)
+        worker.signals.cancelled.connect(self.on_render_cancelled)
+        self.current_worker = worker
+
+        self.loading_spinner.show_with_text("Processing")
+        self.render_pool.start(worker)
+
+    def cancel_render(self):
+        """Ask the in-flight render, if any, to stop at its next checkpoint"""
+        if self.current_worker:
+            self.current_worker.cancel()
+            # The worker may still be writing segments; its output is
+            # deleted when it reports back
+            self.cancelled_outputs[self.current_worker.job_id] = self.current_worker.output_path
+            self.current_worker = None
+
+    def discard_render(self, job_id: int, output_path=None):
+        """Delete the output of a render that is no longer wanted, now that its worker has stopped"""
+        cancelled_path = self.cancelled_outputs.pop(job_id, None)
+        for path in dict.fromkeys(filter(None, (cancelled_path, output_path))):
+            if path == self.current_output:
+                self.media_player.stop()
+                self.media_player.setSource(QUrl())
+                self.current_output = None
+            remove_render_output(path)
 
     def show_error(self, message: str):
         """Show an error message to the user"""
@@ -749,55 +819,129 @@ class TTS(QMainWindow):
         popup.setLayout(layout)
         popup.exec()
 
-    def _process_text(self):
-        """Process text to sign language video (runs in background)"""
-        try:
-            # Get and validate input text
-            text = self.text_input.toPlainText().strip()
-            if not text:
-                self.show_error("Please enter some text first!")
-                return
+    def on_render_progress(self, job_id: int, percent: int, message: str):
+        if job_id != self.render_job_id or job_id == self.streaming_job_id:
+            return
+        self.loading_spinner.show_with_text(f"{message} ({percent}%)")
 
-            # Generate sign language video
-            output_path = text_to_sign(text, self.video_names, self.dataset_path)
-            
-            if output_path and os.path.exists(output_path):
-                # Load the generated video
-                video_url = QUrl.fromLocalFile(os.path.abspath(output_path))
-                
-                # Disconnect previous connections to avoid duplicates
-                try:
-                    self.media_player.mediaStatusChanged.disconnect()
-                except:
-                    pass
-                
-                # Connect media status handler
-                self.media_player.mediaStatusChanged.connect(
-                    lambda status: self.handle_media_status(status, output_path)
-                )
-                
-                # Set and play video
-                self.media_player.setSource(video_url)
-                self.media_player.play()
-                self.play_pause_btn.setText("⏸ Pause")
-                self.play_pause_btn.setEnabled(True)
-                
-        except Exception as e:
-            print(f"Error in video processing: {str(e)}")
+    def on_render_cancelled(self, job_id: int):
+        self.discard_render(job_id)
+        if job_id == self.render_job_id:
+            self._finish_render()
+
+    def on_segment_ready(self, job_id: int, playlist_path: str):
+        """Start playing as soon as the first word of the current job is ready"""
+        if job_id != self.render_job_id:
+            return
+        self.streaming_job_id = job_id
+        self.loading_spinner.hide()
+        self.play_output(playlist_path)
+
+    def on_render_finished(self, job_id: int, output_path):
+        """Finish the current job, loading the video if it is not already playing"""
+        if job_id != self.render_job_id or job_id in self.cancelled_outputs:
+            # A cancelled job that finished before it noticed the cancel
+            self.discard_render(job_id, output_path)
+            if job_id == self.render_job_id:
+                self._finish_render()
+            return
+
+        self._finish_render()
+
+        if not output_path or not os.path.exists(output_path):
             self.show_error("Failed to generate sign language video")
-            
-        finally:
-            # Always reset processing flag and enable UI
-            self.is_processing = False
-            self.text_input.setEnabled(True)
-            self.play_pause_btn.setEnabled(True)
+            return
+
+        if self.streaming_job_id != job_id:
+            self.play_output(output_path)
+        else:
+            # Pick up the complete track now that every segment is listed
+            self.timing = load_timing(output_path)
+        self.apply_speed_variant()
+
+    def reset_speed_variants(self):
+        """Forget the variants of the previous video; ones still rendering are deleted when they finish"""
+        self.speed_variants = {}
+        self.pending_variants = set()
+        self.playing_speed = 1.0
+        self.pending_seek = None
+
+    def play_output(self, output_path: str):
+        self.current_output = output_path
+        self.timing = load_timing(output_path)
+        self.reset_speed_variants()
+        self.media_player.setPlaybackRate(self.speed_slider.value() / 100.0)
+
+        # Load the generated video
+        video_url = QUrl.fromLocalFile(os.path.abspath(output_path))
+
+        # Set and play video
+        self.media_player.setSource(video_url)
+        self.media_player.play()
+        self.play_pause_btn.setText("⏸ Pause")
+
+    def timing_entry_at(self, seconds: float):
+        """Return the sign being shown at a playback time, or the last one before it"""
+        if self.timing is None and self.current_output:
+            self.timing = load_timing(self.current_output)
+        if not self.timing:
+            return None
+        entries = self.timing['entries']
+        if self.is_processing and entries and seconds > entries[-1]['end'] and self.current_output:
+            # A streaming render has published more segments since
+            self.timing = load_timing(self.current_output) or self.timing
+            entries = self.timing['entries']
+        current = None
+        for entry in entries:
+            if entry['start'] > seconds:
+                break
+            current = entry
+        return current
+
+    def timing_matches_text(self) -> bool:
+        """Word spans are only valid while the text is unchanged since sending"""
+        return self.timing is not None and self.text_input.toPlainText() == self.rendered_text
+
+    def update_word_highlight(self, position: int):
+        """Highlight the word whose sign is on screen"""
+        entry = self.timing_entry_at(position / 1000.0 * self.playing_speed)
+        if not entry or not entry['text_span'] or not self.timing_matches_text():
+            self.text_input.clear_highlight()
+            return
+        start, end = entry['text_span']
+        self.text_input.highlight_range(start + self.text_offset, end + self.text_offset)
+
+    def seek_to_word(self, char_position: int):
+        """Jump the video to the sign for the word at a text position"""
+        if not self.timing_matches_text():
+            return
+        position = char_position - self.text_offset
+        for entry in self.timing['entries']:
+            span = entry['text_span']
+            if span and span[0] <= position <= span[1]:
+                self.media_player.setPosition(int(entry['start'] * 1000 / self.playing_speed))
+                if self.media_player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+                    self.media_player.play()
+                    self.play_pause_btn.setText("⏸ Pause")
+                return
+
+    def _finish_render(self):
+        # Always reset processing flag and enable UI
+        self.current_worker = None
+        self.is_processing = False
+        self.loading_spinner.hide()
+        self.text_input.setEnabled(True)
+        self.play_pause_btn.setEnabled(True)
 
     def cleanup(self):
         """Clean up resources when switching tabs"""
         try:
+            self.cancel_render()
+            self.loading_spinner.hide()
             self.media_player.stop()
             self.media_player.setSource(QUrl())
             self.is_processing = False
+            self.text_input.clear_highlight()
             self.play_pause_btn.setText("▶ Play")
         except:
             pass
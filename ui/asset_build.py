@@ -0,0 +1,251 @@
+"""Normalize the bundled sign clips for fast start-up and seeking.
+
+The clips in assets/*_videos come from different sources: anything from
+320x240 to 1080p, portrait and landscape, 25 to 30 fps, keyframes seconds
+apart, extra audio and data tracks, and the moov atom at either end of the
+file. This probes every clip and re-encodes the ones that differ from one
+low-latency profile: ASSET_PROFILE's size (letter- or pillarboxed) and frame
+rate, H.264 without B-frames, a keyframe every GOP_SECONDS, and the moov
+atom first so players can start before reading the whole file:
+
+    python -m ui.asset_build                 # report what would change
+    python -m ui.asset_build --apply --report build.json
+
+With --apply each outlier is replaced in place once its new encode has been
+decoded back successfully. The report lists size and single-threaded decode
+time before and after for every clip. Nothing on this path imports Qt.
+"""
+
+# Standard library imports
+import argparse
+import json
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+# Third-party imports
+from moviepy.config import get_setting
+
+from ui.assets import PACKAGE_DIR
+from ui.render_profiles import RenderProfile
+from ui.video_previews import find_clips
+
+ASSET_PROFILE = RenderProfile('assets', (640, 480), 30, 'medium', 23, 'mp4')
+GOP_SECONDS = 0.5
+AUDIO_BITRATE = '96k'
+
+VIDEO_STREAM = re.compile(r'Stream #\S+.*?: Video: (\w+).*?, (\w+)(?:\([^)]*\))*, (\d+)x(\d+)')
+FPS = re.compile(r'([\d.]+) fps')
+LFS_POINTER = b'version https://git-lfs'
+
+
+class ClipInfo(NamedTuple):
+    codec: str
+    pix_fmt: str
+    size: tuple
+    fps: float
+    duration: float
+    audio_streams: int
+    other_streams: int
+    keyframes: int
+    moov_first: bool
+
+
+# Helper functions
+def moov_first(path: str) -> bool:
+    """Whether the MP4 index comes before the media data, so playback can start early"""
+    with open(path, 'rb') as file:
+        while True:
+            header = file.read(8)
+            if len(header) < 8:
+                return False
+            size, kind = struct.unpack('>I4s', header)
+            if kind == b'moov':
+                return True
+            if kind == b'mdat':
+                return False
+            if size == 1:
+                size = struct.unpack('>Q', file.read(8))[0]
+                file.seek(size - 16, os.SEEK_CUR)
+            elif size < 8:
+                return False
+            else:
+                file.seek(size - 8, os.SEEK_CUR)
+
+def probe(path: str) -> ClipInfo:
+    """Stream layout, keyframe count and moov position of a clip"""
+    with open(path, 'rb') as file:
+        if file.read(len(LFS_POINTER)) == LFS_POINTER:
+            raise ValueError("Git LFS pointer, run 'git lfs pull' first")
+    result = subprocess.run(
+        [get_setting("FFMPEG_BINARY"), '-hide_banner', '-skip_frame', 'nokey', '-i', path,
+         '-map', '0:v:0', '-vf', 'showinfo', '-f', 'null', '-'],
+        capture_output=True
+    )
+    output = result.stderr.decode(errors='replace')
+    if result.returncode != 0:
+        raise ValueError(output.strip().splitlines()[-1] if output.strip() else "unreadable")
+
+    header = output.split('Stream mapping:')[0]
+    video = VIDEO_STREAM.search(header)
+    if not video:
+        raise ValueError("no video stream")
+    video_line = header[video.start():].splitlines()[0]
+    fps = FPS.search(video_line)
+    duration = re.search(r'Duration: (\d+):(\d+):([\d.]+)', header)
+    streams = re.findall(r'Stream #\S+.*?: (\w+):', header)
+    return ClipInfo(
+        codec=video.group(1),
+        pix_fmt=video.group(2),
+        size=(int(video.group(3)), int(video.group(4))),
+        fps=float(fps.group(1)) if fps else 0.0,
+        duration=int(duration.group(1)) * 3600 + int(duration.group(2)) * 60 + float(duration.group(3)) if duration else 0.0,
+        audio_streams=streams.count('Audio'),
+        other_streams=len(streams) - 1 - streams.count('Audio'),
+        keyframes=len(re.findall(r'\] n:\s*\d+', output)),
+        moov_first=moov_first(path),
+    )
+
+def nonconformities(info: ClipInfo, profile: RenderProfile = ASSET_PROFILE) -> List[str]:
+    """Ways a clip differs from the asset profile; empty if it already conforms"""
+    reasons = []
+    if info.codec != 'h264':
+        reasons.append(f"codec {info.codec}")
+    if info.pix_fmt != 'yuv420p':
+        reasons.append(f"pixel format {info.pix_fmt}")
+    if info.size != tuple(profile.size):
+        reasons.append(f"size {info.size[0]}x{info.size[1]}")
+    if abs(info.fps - profile.fps) > 0.01:
+        reasons.append(f"{info.fps:g} fps")
+    if info.duration and info.keyframes and info.duration / info.keyframes > GOP_SECONDS * 1.5:
+        reasons.append(f"keyframe every {info.duration / info.keyframes:.1f}s")
+    if info.audio_streams > 1 or info.other_streams:
+        reasons.append("extra streams")
+    if not info.moov_first:
+        reasons.append("moov at end")
+    return reasons
+
+def decode_time(path: str) -> float:
+    """Seconds to decode every video frame on one thread"""
+    start = time.perf_counter()
+    subprocess.run(
+        [get_setting("FFMPEG_BINARY"), '-loglevel', 'error', '-threads', '1', '-i', path,
+         '-map', '0:v:0', '-f', 'null', '-'],
+        check=True, capture_output=True
+    )
+    return time.perf_counter() - start
+
+def encoder_args(profile: RenderProfile = ASSET_PROFILE) -> List[str]:
+    width, height = profile.size
+    gop = max(1, int(round(profile.fps * GOP_SECONDS)))
+    return [
+        '-map', '0:v:0', '-map', '0:a:0?',
+        '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease,'
+               f'pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1',
+        '-r', str(profile.fps),
+        *profile.encoder_args(),
+        '-tune', 'fastdecode', '-bf', '0', '-g', str(gop), '-keyint_min', str(gop),
+        '-sc_threshold', '0', '-pix_fmt', 'yuv420p',
+        '-c:a', 'aac', '-b:a', AUDIO_BITRATE, '-ac', '2',
+        '-movflags', '+faststart',
+    ]
+
+def transcode(path: str, profile: RenderProfile = ASSET_PROFILE) -> str:
+    """Encode a clip with the asset profile next to the original, returning the new file"""
+    partial = f"{os.path.splitext(path)[0]}.{os.getpid()}.part.mp4"
+    try:
+        subprocess.run(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error', '-i', path,
+             *encoder_args(profile), partial],
+            check=True, capture_output=True
+        )
+    except subprocess.CalledProcessError:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return partial
+
+
+def build_clip(path: str, apply: bool, backup_dir: Optional[str] = None) -> dict:
+    """Probe one clip and, with apply, replace it if it does not conform"""
+    entry = {'clip': os.path.relpath(path, PACKAGE_DIR), 'size_before': os.path.getsize(path)}
+    try:
+        info = probe(path)
+    except (OSError, ValueError) as e:
+        entry['error'] = f"probe failed: {e}"
+        return entry
+
+    entry['reasons'] = nonconformities(info)
+    if not entry['reasons'] or not apply:
+        return entry
+
+    partial = None
+    try:
+        entry['decode_before'] = decode_time(path)
+        partial = transcode(path)
+        # Decoding the new file back is both the timing and the check that it is sound
+        entry['decode_after'] = decode_time(partial)
+        entry['size_after'] = os.path.getsize(partial)
+        if backup_dir:
+            backup = os.path.join(backup_dir, entry['clip'])
+            os.makedirs(os.path.dirname(backup), exist_ok=True)
+            shutil.copy2(path, backup)
+        os.replace(partial, path)
+        entry['transcoded'] = True
+    except (OSError, subprocess.CalledProcessError) as e:
+        entry['error'] = f"transcode failed: {e}"
+        if partial and os.path.exists(partial):
+            os.remove(partial)
+    return entry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui.asset_build", description="Normalize the bundled sign clips to one low-latency profile")
+    parser.add_argument('--apply', action='store_true', help="Re-encode non-conforming clips in place (default: only report)")
+    parser.add_argument('--backup', metavar='DIR', help="Copy originals here before replacing them")
+    parser.add_argument('--report', metavar='PATH', help="Write the per-clip report as JSON")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help="Clips to process at the same time")
+    args = parser.parse_args(argv)
+
+    clips = find_clips()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="asset") as executor:
+        entries = list(executor.map(lambda path: build_clip(path, args.apply, args.backup), clips))
+    elapsed = time.perf_counter() - start
+
+    for entry in entries:
+        if entry.get('error'):
+            print(f"Warning: {entry['clip']}: {entry['error']}")
+        elif entry['reasons'] and not entry.get('transcoded'):
+            print(f"{entry['clip']}: {', '.join(entry['reasons'])}")
+
+    outliers = [entry for entry in entries if entry.get('reasons')]
+    done = [entry for entry in entries if entry.get('transcoded')]
+    failed = sum(1 for entry in entries if entry.get('error'))
+    print(f"{len(clips)} clips probed in {elapsed:.1f}s: {len(outliers)} outside the asset profile, "
+          f"{len(clips) - len(outliers) - failed} conforming, {failed} unreadable")
+    if done:
+        size_before = sum(entry['size_before'] for entry in done)
+        size_after = sum(entry['size_after'] for entry in done)
+        decode_before = sum(entry['decode_before'] for entry in done)
+        decode_after = sum(entry['decode_after'] for entry in done)
+        print(f"Re-encoded {len(done)} clips: {size_before / 1024 / 1024:.1f} MiB -> {size_after / 1024 / 1024:.1f} MiB "
+              f"({1 - size_after / size_before:.0%} smaller), decode {decode_before:.2f}s -> {decode_after:.2f}s "
+              f"({1 - decode_after / decode_before:.0%} faster)")
+    elif outliers and not args.apply:
+        print("Run with --apply to re-encode them")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as file:
+            json.dump({'profile': ASSET_PROFILE._asdict(), 'gop_seconds': GOP_SECONDS, 'clips': entries}, file, indent=2)
+    return 1 if failed and failed == len(clips) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# Standard library imports
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+
+# Every file the app ships is found through one registry. The assets
+# folder is listed once, on first use, into a case-insensitive index, so a
+# lookup is a dictionary hit instead of a series of os.path.exists calls,
+# and it works whatever the current directory is and whatever case the
+# files were saved in. Directories outside assets (such as the text-to-sign
+# dataset) are listed the first time they are asked about. Nothing here
+# imports Qt, so render worker processes can use it too.
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(PACKAGE_DIR, "assets")
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def package_path(path: str) -> str:
+    """Absolute form of a path given relative to the package root"""
+    return os.path.normpath(path if os.path.isabs(path) else os.path.join(PACKAGE_DIR, path))
+
+
+class AssetRegistry:
+    """Case-insensitive file index: directory -> lower-cased file name -> path"""
+
+    def __init__(self, root: str = ASSETS_DIR):
+        self._listings: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        for directory, _, names in os.walk(root):
+            self._listings[self._key(directory)] = {
+                name.lower(): os.path.join(directory, name) for name in names
+            }
+
+    @staticmethod
+    def _key(directory: str) -> str:
+        return os.path.normcase(package_path(directory))
+
+    def listing(self, directory: str) -> Dict[str, str]:
+        """Files of a directory by lower-cased name, listed on first use.
+
+        A directory that does not exist yet is not remembered, so it is
+        found once it has been created.
+        """
+        key = self._key(directory)
+        listing = self._listings.get(key)
+        if listing is None:
+            path = package_path(directory)
+            if not os.path.isdir(path):
+                return {}
+            listing = {name.lower(): os.path.join(path, name) for name in os.listdir(path)}
+            with self._lock:
+                self._listings[key] = listing
+        return listing
+
+    def refresh(self, directory: str):
+        """Forget a directory's listing so it is read again on next use"""
+        with self._lock:
+            self._listings.pop(self._key(directory), None)
+
+    def resolve(self, path: str) -> Optional[str]:
+        """Absolute path of an existing file, matching its name in any case"""
+        directory, name = os.path.split(path)
+        return self.listing(directory).get(name.lower())
+
+    def find(self, directory: str, names: Iterable[str], extensions=('.mp4',)) -> Optional[str]:
+        """First file in directory called one of names (any case) with one of extensions"""
+        listing = self.listing(directory)
+        if isinstance(names, str):
+            names = [names]
+        for name in names:
+            for extension in extensions:
+                path = listing.get(f"{name.strip()}{extension}".lower())
+                if path:
+                    return path
+        return None
+
+    def files(self, directory: str, extensions=('.mp4',)) -> List[str]:
+        """Files in directory with one of extensions, sorted by name"""
+        return sorted(path for name, path in self.listing(directory).items()
+                      if name.endswith(tuple(extensions)))
+
+    def directories(self, parent: str = ASSETS_DIR) -> List[str]:
+        """Indexed subdirectories directly below parent"""
+        parent_key = self._key(parent)
+        return sorted(key for key in self._listings if os.path.dirname(key) == parent_key)
+
+
+def get_asset_registry() -> AssetRegistry:
+    """Process-wide asset registry, created on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = AssetRegistry()
+        return _registry
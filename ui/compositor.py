@@ -0,0 +1,163 @@
+# Standard library imports
+import subprocess
+from typing import List, Optional
+
+# Third-party imports
+import numpy as np
+from moviepy.config import get_setting
+
+# Clips that are already the same size need no canvas or blending: frames are
+# decoded straight to raw YUV420 at the output size, read into one reused
+# buffer and written to a single ffmpeg encoder. Gaps are the same black
+# frame written repeatedly, so memory stays at a couple of frames however
+# long the output is.
+
+
+def black_frame(size) -> np.ndarray:
+    """One raw YUV420 frame of limited-range black: Y=16, U=V=128"""
+    width, height = size
+    frame = np.full(width * height * 3 // 2, 128, dtype=np.uint8)
+    frame[:width * height] = 16
+    return frame
+
+
+class FrameCompositor:
+    """Encode same-size clips and gaps back to back through one ffmpeg pipe.
+
+    Frames are written at frame_size and frame_rate, which default to the
+    output's; when they differ, the encoder scales and re-times them.
+    """
+
+    def __init__(self, output_path: str, size, fps: int, encoder_args: Optional[List[str]] = None,
+                 frame_size=None, frame_rate: Optional[int] = None):
+        self.output_path = output_path
+        self.size = frame_size or size
+        self.fps = frame_rate or fps
+        width, height = self.size
+        self.frame_bytes = width * height * 3 // 2
+        self.frame = np.empty(self.frame_bytes, dtype=np.uint8)
+        self.black_frame = black_frame(self.size)
+        self.frames_written = 0
+        encoder_args = encoder_args or ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23']
+        out_width, out_height = size
+        resample = (['-vf', f'scale={out_width}:{out_height},fps={fps}']
+                    if (out_width, out_height) != (width, height) or fps != self.fps else [])
+        self.process = subprocess.Popen(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'yuv420p', '-s', f'{width}x{height}',
+             '-framerate', str(self.fps), '-i', '-',
+             *resample, *encoder_args, '-pix_fmt', 'yuv420p', output_path],
+            stdin=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
+    def _read_frame(self, stream) -> bool:
+        """Fill the frame buffer from a raw stream, False at end of stream"""
+        view = memoryview(self.frame)
+        filled = 0
+        while filled < self.frame_bytes:
+            count = stream.readinto(view[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def add_clip(self, video_path: str, speed: float = 1.0) -> int:
+        """Decode a clip at the frame size and rate, returning its frame count.
+
+        With a speed other than 1, the clip is re-timed by dropping or
+        repeating frames.
+        """
+        width, height = self.size
+        retime = f'setpts=PTS/{speed:g},' if speed != 1.0 else ''
+        decoder = subprocess.Popen(
+            [get_setting("FFMPEG_BINARY"), '-loglevel', 'error', '-i', video_path,
+             '-vf', f'{retime}scale={width}:{height},fps={self.fps}',
+             '-an', '-pix_fmt', 'yuv420p', '-f', 'rawvideo', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        count = 0
+        try:
+            while self._read_frame(decoder.stdout):
+                self.process.stdin.write(self.frame)
+                count += 1
+        finally:
+            decoder.stdout.close()
+            error = decoder.stderr.read()
+            decoder.wait()
+        if decoder.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to decode {video_path}: {error.decode(errors='replace')}")
+        self.frames_written += count
+        return count
+
+    def add_frames(self, frames) -> int:
+        """Append raw YUV420 frames at the frame size, given back to back"""
+        count = len(frames) // self.frame_bytes
+        self.process.stdin.write(frames)
+        self.frames_written += count
+        return count
+
+    def add_gap(self, duration: float) -> int:
+        """Append black frames for the given number of seconds"""
+        return self.add_still(self.black_frame, duration)
+
+    def add_still(self, frame, duration: float) -> int:
+        """Append one raw YUV420 frame repeated for the given number of seconds"""
+        count = int(round(duration * self.fps))
+        for _ in range(count):
+            self.process.stdin.write(frame)
+        self.frames_written += count
+        return count
+
+    def add_crossfade(self, first, last, duration: float) -> int:
+        """Append frames blending linearly from one raw frame to another"""
+        count = int(round(duration * self.fps))
+        first = np.frombuffer(first, dtype=np.uint8).astype(np.uint16)
+        last = np.frombuffer(last, dtype=np.uint8).astype(np.uint16)
+        blend = np.empty(self.frame_bytes, dtype=np.uint16)
+        for i in range(1, count + 1):
+            np.add(first * (count + 1 - i), last * i, out=blend)
+            blend //= count + 1
+            self.frame[:] = blend
+            self.process.stdin.write(self.frame)
+        self.frames_written += count
+        return count
+
+    def close(self) -> Optional[str]:
+        """Finish the encode, returning the output path or None if it is empty"""
+        self.process.stdin.close()
+        error = self.process.stderr.read()
+        self.process.wait()
+        if self.process.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to encode {self.output_path}: {error.decode(errors='replace')}")
+        return self.output_path if self.frames_written else None
+
+    def abort(self):
+        """Stop the encoder without waiting for it to finish the file"""
+        self.process.kill()
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stderr):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+def read_frame(video_path: str, size, last: bool = False) -> Optional[bytes]:
+    """Decode the first or last frame of a video as raw YUV420 at the given size"""
+    width, height = size
+    frame_bytes = width * height * 3 // 2
+    # Only the final second is decoded for the last frame
+    seek = ['-sseof', '-1'] if last else []
+    limit = [] if last else ['-frames:v', '1']
+    result = subprocess.run(
+        [get_setting("FFMPEG_BINARY"), '-loglevel', 'error', *seek, '-i', video_path,
+         '-vf', f'scale={width}:{height}', '-an', *limit, '-pix_fmt', 'yuv420p', '-f', 'rawvideo', '-'],
+        check=True, capture_output=True
+    )
+    frames = result.stdout
+    if len(frames) < frame_bytes:
+        return None
+    if last:
+        end = len(frames) - len(frames) % frame_bytes
+        return frames[end - frame_bytes:end]
+    return frames[:frame_bytes]
@@ -0,0 +1,113 @@
+# Standard library imports
+import os
+import subprocess
+import threading
+from typing import Dict, Iterable, Iterator, Optional
+
+# Third-party imports
+from moviepy.config import get_setting
+
+from ui.assets import ASSETS_DIR, get_asset_registry
+from ui.compositor import FrameCompositor, black_frame
+
+# Letter clips are kept decoded in memory as raw YUV420 frames at a reduced
+# size and frame rate. Spelling a word is then a memory copy into a single
+# ffmpeg encode instead of opening one file per letter (plus one per gap).
+
+LETTER_VIDEOS_PATH = os.path.join(ASSETS_DIR, "asl_videos")
+SPRITE_SIZE = (240, 180)
+SPRITE_FPS = 15
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class FingerspellingCache:
+    """Decoded letter clips, shared by every render in the process"""
+
+    def __init__(self, videos_path: str = LETTER_VIDEOS_PATH, size=SPRITE_SIZE, fps: int = SPRITE_FPS):
+        self.videos_path = videos_path
+        self.size = size
+        self.fps = fps
+        width, height = size
+        self.frame_bytes = width * height * 3 // 2
+        self.black_frame = black_frame(size).tobytes()
+        self._frames: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._index = {
+            os.path.splitext(os.path.basename(path))[0].lower(): path
+            for path in get_asset_registry().files(videos_path)
+        }
+
+    def has_letter(self, letter: str) -> bool:
+        return letter.lower() in self._index
+
+    def letter_path(self, letter: str) -> Optional[str]:
+        """Source clip of a letter"""
+        return self._index.get(letter.lower())
+
+    def letter_frames(self, letter: str) -> Optional[bytes]:
+        """Return all frames of a letter back to back, decoding on first use"""
+        letter = letter.lower()
+        with self._lock:
+            if letter in self._frames:
+                return self._frames[letter]
+            path = self._index.get(letter)
+            if not path:
+                return None
+            width, height = self.size
+            result = subprocess.run(
+                [get_setting("FFMPEG_BINARY"), '-loglevel', 'error', '-i', path,
+                 '-vf', f'scale={width}:{height},fps={self.fps}',
+                 '-pix_fmt', 'yuv420p', '-f', 'rawvideo', '-'],
+                check=True, capture_output=True
+            )
+            frames = result.stdout
+            frames = frames[:len(frames) - len(frames) % self.frame_bytes]
+            self._frames[letter] = frames
+            return frames
+
+    def preload(self):
+        """Decode every letter up front, e.g. from a background thread"""
+        for letter in list(self._index):
+            self.letter_frames(letter)
+
+    def memory_usage(self) -> int:
+        return sum(len(frames) for frames in self._frames.values())
+
+    def gap_frames(self, duration: float) -> bytes:
+        return self.black_frame * int(round(duration * self.fps))
+
+    def spell(self, letters: Iterable[str], gap: float = 0.0, trailing_gap: float = 0.0) -> Iterator[bytes]:
+        """Yield the raw frames for a spelled word, one chunk per letter or gap"""
+        letters = [letter for letter in letters if self.has_letter(letter)]
+        for i, letter in enumerate(letters):
+            yield self.letter_frames(letter)
+            pause = gap if i < len(letters) - 1 else trailing_gap
+            if pause:
+                yield self.gap_frames(pause)
+
+    def render(self, letters: Iterable[str], output_path: str, size, fps: int,
+               gap: float = 0.0, trailing_gap: float = 0.0, encoder_args=None) -> Optional[str]:
+        """Encode a spelled word to a video file at the given output size and fps, or return None"""
+        letters = [letter for letter in letters if self.has_letter(letter)]
+        if not letters:
+            return None
+        compositor = FrameCompositor(output_path, size, fps, encoder_args,
+                                     frame_size=self.size, frame_rate=self.fps)
+        try:
+            for chunk in self.spell(letters, gap, trailing_gap):
+                compositor.add_frames(chunk)
+        except Exception:
+            compositor.abort()
+            raise
+        return compositor.close()
+
+
+def get_fingerspelling_cache() -> FingerspellingCache:
+    """Process-wide letter cache, created on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FingerspellingCache()
+        return _cache
@@ -0,0 +1,163 @@
+# Standard library imports
+import os
+import sys
+import threading
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
+
+# NLTK is imported inside the functions below so that modules which only
+# render clips (including worker processes) never pay for loading it, and
+# nothing here touches the network or disk until the first translation.
+
+SYNONYM_SENSES = 3  # Only the most common senses, to keep the meaning close
+
+# Local data dir, resolved from the package rather than the working
+# directory. Run `python -m ui.gloss` once to populate it for offline use.
+NLTK_DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "text-to-sign", "nltk_data"
+)
+NLTK_RESOURCES = {
+    'wordnet': 'corpora/wordnet',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+}
+
+_lemmatizer = None
+_nltk_ready = None
+# Render service jobs and subtitle cue workers translate at the same time:
+# one lock keeps them from downloading into NLTK_DATA_DIR twice, and from
+# racing on the first access to the lazily loaded WordNet corpus
+_nltk_lock = threading.Lock()
+
+
+# Helper functions
+def get_wordnet_pos(tag):
+    from nltk.corpus import wordnet
+
+    if tag.startswith('J'):
+        return wordnet.ADJ
+    elif tag.startswith('V'):
+        return wordnet.VERB
+    elif tag.startswith('N'):
+        return wordnet.NOUN
+    elif tag.startswith('R'):
+        return wordnet.ADV
+    else:
+        return wordnet.NOUN
+
+def missing_nltk_resources() -> List[str]:
+    import nltk
+
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+
+    missing = []
+    for name, resource in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+def download_nltk_data(names=None) -> bool:
+    """Download resources into the local data dir, returning success"""
+    import nltk
+
+    os.makedirs(NLTK_DATA_DIR, exist_ok=True)
+    ok = True
+    for name in names if names is not None else NLTK_RESOURCES:
+        ok = nltk.download(name, download_dir=NLTK_DATA_DIR, quiet=True) and ok
+    return ok
+
+def ensure_nltk_data() -> bool:
+    """Check the NLTK resources once per process, fetching any that are missing.
+
+    Called on the first translation rather than at import time. When the
+    data cannot be found or fetched (e.g. offline), gloss normalization is
+    skipped and words are fingerspelled as before.
+    """
+    global _nltk_ready
+    with _nltk_lock:
+        if _nltk_ready is None:
+            missing = missing_nltk_resources()
+            if missing:
+                download_nltk_data(missing)
+                missing = missing_nltk_resources()
+            if not missing:
+                from nltk.corpus import wordnet
+                try:
+                    # Swap the lazy loader for the real reader while holding the lock
+                    wordnet.ensure_loaded()
+                except LookupError:
+                    missing = ['wordnet']
+            _nltk_ready = not missing
+            if missing:
+                print(f"Warning: NLTK data not available ({', '.join(missing)}), skipping gloss normalization")
+    return _nltk_ready
+
+def get_lemmatizer():
+    global _lemmatizer
+    with _nltk_lock:
+        if _lemmatizer is None:
+            from nltk.stem import WordNetLemmatizer
+            _lemmatizer = WordNetLemmatizer()
+    return _lemmatizer
+
+def tag_words(words: List[str]) -> List[str]:
+    """Return a WordNet POS for every word, tagged in sentence context"""
+    if not ensure_nltk_data():
+        return ['n'] * len(words)
+
+    import nltk
+
+    try:
+        return [get_wordnet_pos(tag) for _, tag in nltk.pos_tag(words)]
+    except LookupError:
+        return ['n'] * len(words)
+
+@lru_cache(maxsize=4096)
+def match_vocabulary(word: str, pos: str, vocabulary: FrozenSet[str]) -> Optional[str]:
+    """Map an out-of-vocabulary word onto a dataset gloss, or None.
+
+    Tries the lemma for the tagged POS first, then the lemmas for the other
+    parts of speech, then WordNet synonyms of the word. Memoized, so the
+    NLTK cost is paid once per word.
+    """
+    if not ensure_nltk_data():
+        return None
+
+    from nltk.corpus import wordnet
+
+    try:
+        lemmatizer = get_lemmatizer()
+        other_pos = [p for p in (wordnet.NOUN, wordnet.VERB, wordnet.ADJ, wordnet.ADV) if p != pos]
+        lemmas = []
+        for p in [pos] + other_pos:
+            lemma = lemmatizer.lemmatize(word, p)
+            if lemma in vocabulary:
+                return lemma
+            if lemma not in lemmas:
+                lemmas.append(lemma)
+
+        # Very short words have too many unrelated senses to substitute
+        if len(word) <= 2:
+            return None
+
+        for lemma in lemmas:
+            for synset in wordnet.synsets(lemma, pos=pos)[:SYNONYM_SENSES]:
+                for name in synset.lemma_names():
+                    synonym = name.replace('_', ' ').lower()
+                    if synonym in vocabulary:
+                        return synonym
+    except LookupError:
+        pass
+    return None
+
+
+if __name__ == "__main__":
+    # Vendor the NLTK resources into the local data dir
+    if download_nltk_data():
+        print(f"NLTK data ready in {NLTK_DATA_DIR}")
+    else:
+        print("Error: could not download NLTK data")
+        sys.exit(1)
@@ -0,0 +1,122 @@
+# Standard library imports
+import hashlib
+import os
+
+# Third-party imports
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+from ui.assets import PACKAGE_DIR, get_asset_registry
+
+# Pictures are shipped at camera resolution (the card images are up to
+# 2048 px tall) but shown a few hundred pixels wide. Each one is scaled to
+# its display size once and the result kept on disk, and the decoded
+# pixmap is kept in QPixmapCache, so showing it again costs a lookup.
+
+IMAGE_CACHE_VERSION = 1  # Bump when the way variants are made changes
+IMAGE_CACHE_DIR = os.path.join(PACKAGE_DIR, "cache", "images", f"v{IMAGE_CACHE_VERSION}")
+PIXMAP_CACHE_KB = 48 * 1024  # Room for the 26 letter images and the page pictures
+JPEG_QUALITY = 88
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Every picture the interface shows (a file, or a folder of them), with the
+# size it is shown at
+DISPLAY_SIZES = [
+    ("assets/asl_images", (450, 450)),
+    ("assets/cards_image", (450, 350)),
+    ("assets/sign_to_text_image.jpg", (300, 200)),
+    ("assets/text_to_sign_image.jpg", (300, 200)),
+    ("assets/beginner.jpg", (1200, 270)),
+    ("assets/intermediate.png", (1200, 270)),
+    ("assets/logo.png", (100, 50)),
+]
+
+_limit_set = False
+
+
+def variant_path(image_path: str, width: int, height: int) -> str:
+    """Cache file for an image scaled to fit width x height.
+
+    The source's size and modification time are part of the name, so a
+    replaced picture gets a new variant.
+    """
+    stat = os.stat(image_path)
+    key = repr((os.path.abspath(image_path), stat.st_size, stat.st_mtime_ns))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    extension = ".png" if image_path.lower().endswith(".png") else ".jpg"
+    return os.path.join(IMAGE_CACHE_DIR, f"{width}x{height}", f"{digest}{extension}")
+
+
+def build_variant(image_path: str, width: int, height: int) -> str:
+    """Write the scaled variant of an image if it is missing, returning its path.
+
+    Uses QImage only, so it runs without a QApplication and off the GUI thread.
+    """
+    path = variant_path(image_path, width, height)
+    if os.path.exists(path):
+        return path
+
+    image = QImage(image_path)
+    if image.isNull():
+        raise ValueError(f"Cannot read image '{image_path}'")
+    if image.width() > width or image.height() > height:
+        image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial = f"{path}.{os.getpid()}.part{os.path.splitext(path)[1]}"
+    quality = JPEG_QUALITY if path.endswith(".jpg") else -1
+    if not image.save(partial, None, quality):
+        raise OSError(f"Cannot write image cache file '{partial}'")
+    os.replace(partial, path)
+    return path
+
+
+def load_pixmap(image_path: str, width: int, height: int) -> QPixmap:
+    """A pixmap of the image scaled to fit width x height, or a null pixmap if it is missing"""
+    global _limit_set
+    if not _limit_set:
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_KB))
+        _limit_set = True
+
+    key = f"{image_path}@{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    image_path = get_asset_registry().resolve(image_path)
+    if not image_path:
+        return QPixmap()
+    try:
+        pixmap = QPixmap(build_variant(image_path, width, height))
+    except (OSError, ValueError) as e:
+        print(f"Warning: {e}, scaling the original instead")
+        pixmap = QPixmap(image_path)
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def prebuild(display_sizes=DISPLAY_SIZES) -> int:
+    """Make the display variant of every picture in display_sizes, returning how many exist"""
+    registry = get_asset_registry()
+    count = 0
+    for path, (width, height) in display_sizes:
+        if os.path.isdir(os.path.join(PACKAGE_DIR, path)):
+            image_paths = registry.files(path, IMAGE_EXTENSIONS)
+        else:
+            image_paths = [image for image in [registry.resolve(path)] if image]
+        for image_path in image_paths:
+            try:
+                build_variant(image_path, width, height)
+                count += 1
+            except (OSError, ValueError) as e:
+                print(f"Warning: {e}")
+    return count
+
+
+if __name__ == "__main__":
+    count = prebuild()
+    print(f"{count} image variants ready in {IMAGE_CACHE_DIR}")
@@ -1,20 +1,37 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame, QScrollArea, QGridLayout, QGraphicsDropShadowEffect)
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer, QRunnable, QThreadPool
 from PySide6.QtGui import QPixmap, QIcon, QColor, QPalette, QLinearGradient, QBrush, QFont
 import os
 from .alphabet_learning import AlphabetLearning
-from .days_learning import DaysLearning
-from .colors_learning import ColorsLearning
-from .numbers_learning import NumbersLearning
-from .months_learning import MonthsLearning
-from .greetings_learning import GreetingsLearning
+from .learning_manifests import MODULES
+from .learning_module import LearningModule
+from .media_pool import get_media_pool
+from .image_cache import load_pixmap
+from .video_previews import find_clips, index_clips
+
+CARD_IMAGE_SIZE = QSize(450, 350)
+
+class PreviewIndexWorker(QRunnable):
+    """Builds the poster frames and previews of clips added since the last run"""
+
+    def run(self):
+        try:
+            index_clips(find_clips(), workers=1)
+        except Exception as e:
+            print(f"Error indexing video previews: {str(e)}")
 
 class LearningSection(QWidget):
     def __init__(self):
         super().__init__()
+        # Learning pages by manifest key, created on first visit and kept
+        self.sections = {}
         self.init_ui()
+        # Start a media player once the window is up, so the first sign
+        # opened in any module doesn't wait for the backend
+        QTimer.singleShot(0, get_media_pool().warm)
+        QThreadPool.globalInstance().start(PreviewIndexWorker())
 
     def init_ui(self):
         self.main_layout = QVBoxLayout(self)
@@ -50,17 +67,9 @@ class LearningSection(QWidget):
         self.grid_layout.setSpacing(20)
         self.grid_layout.setContentsMargins(20, 20, 20, 20)
         
-        # Define categories with local image paths
-        self.categories = [
-            ("", "assets/cards_image/alphabet.jpg", "", "#FF6B6B"),
-            ("", "assets/cards_image/greetings.jpg", "", "#4ECDC4"), 
-            ("", "assets/cards_image/numbers.jpg", "", "#45B7D1"),
-            ("", "assets/cards_image/days.jpg", "", "#96CEB4"),
-            ("", "assets/cards_image/colours.jpeg", "", "#D4A5A5"),
-            ("", "assets/cards_image/month.jpg", "", "#9B89B3")
-        ]
-        
-        # Arrange cards in a grid
+        # Build the cards once; resizing only moves them between columns
+        self.cards = [self.create_category_card(manifest) for manifest in MODULES.values()]
+        self.columns = None
         self.update_card_layout()
         
         self.scroll.setWidget(self.container)
@@ -110,15 +119,17 @@ class LearningSection(QWidget):
     def update_card_layout(self):
         window_width = self.width()
         columns = max(2, min(3, window_width // 450))  # Updated from 400 to 450
-        
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
-        
-        for index, (title, image_path, description, color) in enumerate(self.categories):
-            card = self.create_category_card(title, image_path, description, color)
+        if columns == self.columns:
+            return
+        self.columns = columns
+
+        for card in self.cards:
+            self.grid_layout.removeWidget(card)
+
+        for index, card in enumerate(self.cards):
             self.grid_layout.addWidget(card, index // columns, index % columns)
 
-    def create_category_card(self, title, image_path, description, color):
+    def create_category_card(self, manifest):
         card = QFrame()
         card.setFixedSize(450, 550)
         card.setStyleSheet(f"""
@@ -141,7 +152,7 @@ class LearningSection(QWidget):
         # Image container
         image_container = QFrame()
         image_container.setStyleSheet(f"""
-            background-color: {color};
+            background-color: {manifest.card_color};
             border-radius: 20px 20px 0 0;
             padding: 0;
         """)
@@ -151,7 +162,7 @@ class LearningSection(QWidget):
         
         image = QLabel()
         image.setAlignment(Qt.AlignCenter)
-        self.load_local_image(image, image_path)
+        self.load_local_image(image, manifest.card_image)
         image_layout.addWidget(image)
         
         layout.addWidget(image_container)
@@ -160,19 +171,7 @@ class LearningSection(QWidget):
         learn_btn.setIcon(QIcon("assets/play_icon.png"))  # Add play icon
         learn_btn.setFixedSize(450, 60)  # Match card width
         learn_btn.setIconSize(QSize(24, 24))  # Icon size
-        button_color = ""
-        if "alphabet" in image_path:
-            button_color = "#FF7777"  # Salmon Red
-        elif "greetings" in image_path:
-            button_color = "#4DC5C9"  # Cyan Blue
-        elif "numbers" in image_path:
-            button_color = "#3FACD0"  # Sky Blue
-        elif "days" in image_path:
-            button_color = "#A2C6C1"  # Soft Teal
-        elif "colours" in image_path:
-            button_color = "#CBAEA9"  # Muted Rose
-        elif "month" in image_path:
-            button_color = "#927CA3"  # Dusty Purple
+        button_color = manifest.button_color
         learn_btn.setStyleSheet(f"""
             QPushButton {{
                 background-color: {button_color};
@@ -196,55 +195,29 @@ class LearningSection(QWidget):
         """)
         learn_btn.setCursor(Qt.PointingHandCursor)
         
-        # Button connections based on image path
-        if "alphabet" in image_path:
-            learn_btn.clicked.connect(self.open_alphabet_learning)
-        elif "days" in image_path:
-            learn_btn.clicked.connect(self.open_days_learning)
-        elif "colours" in image_path:
-            learn_btn.clicked.connect(self.open_colors_learning)
-        elif "numbers" in image_path:
-            learn_btn.clicked.connect(self.open_numbers_learning)
-        elif "month" in image_path:
-            learn_btn.clicked.connect(self.open_months_learning)
-        elif "greetings" in image_path:
-            learn_btn.clicked.connect(self.open_greetings_learning)
-        else:
-            learn_btn.clicked.connect(lambda: self.open_video_player(title))
+        learn_btn.clicked.connect(lambda checked=False, key=manifest.key: self.open_module(key))
         layout.addWidget(learn_btn)
         
         return card
 
-    def open_alphabet_learning(self):
-        self.alphabet_section = AlphabetLearning()
-        self.switch_to_section(self.alphabet_section)
-
-    def open_days_learning(self):
-        self.days_section = DaysLearning()
-        self.switch_to_section(self.days_section)
-
-    def open_colors_learning(self):
-        self.colors_section = ColorsLearning()
-        self.switch_to_section(self.colors_section)
-
-    def open_numbers_learning(self):
-        self.numbers_section = NumbersLearning()
-        self.switch_to_section(self.numbers_section)
-
-    def open_months_learning(self):
-        self.months_section = MonthsLearning()
-        self.switch_to_section(self.months_section)
-
-    def open_greetings_learning(self):
-        self.greetings_section = GreetingsLearning()
-        self.switch_to_section(self.greetings_section)
+    def open_module(self, key):
+        section = self.sections.get(key)
+        if section is None:
+            manifest = MODULES[key]
+            if manifest.fingerspell_names:
+                section = AlphabetLearning(manifest)
+            else:
+                section = LearningModule(manifest)
+            self.sections[key] = section
+        self.switch_to_section(section)
     
     def switch_to_section(self, section):
         # Get the main window
         main_window = self.window()
         
-        # Add the new section to the content area
-        main_window.content_area.addWidget(section)
+        # Add the section to the content area on its first visit only
+        if main_window.content_area.indexOf(section) == -1:
+            main_window.content_area.addWidget(section)
         
         # Set the current widget to the new section
         main_window.content_area.setCurrentWidget(section)
@@ -255,9 +228,9 @@ class LearningSection(QWidget):
             main_window.update_navigation()
 
     def load_local_image(self, image_label, image_path):
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            image_label.setPixmap(pixmap.scaled(450, 350, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        pixmap = load_pixmap(image_path, CARD_IMAGE_SIZE.width(), CARD_IMAGE_SIZE.height())
+        if not pixmap.isNull():
+            image_label.setPixmap(pixmap)
         else:
             image_label.setText("Image not available")
             image_label.setStyleSheet("font-size: 16px; color: #555;")
@@ -270,6 +243,6 @@ class LearningSection(QWidget):
         return shadow
 
     def resizeEvent(self, event):
-        # Update the card layout when the window is resized
+        # Reflow the cards if the window now fits a different number of columns
         self.update_card_layout()
         super().resizeEvent(event)
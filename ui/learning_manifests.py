@@ -0,0 +1,109 @@
+from typing import Dict, List, NamedTuple
+
+# Everything that differs between the learning categories. LearningModule
+# builds the page, the grid and the video popup from one of these, so a new
+# category is a new entry here plus a folder of clips.
+
+
+class ModuleManifest(NamedTuple):
+    key: str
+    title: str
+    card_image: str
+    card_color: str
+    button_color: str
+    asset_dir: str
+    rows: List[List[str]]
+    name_mapping: Dict[str, str] = {}  # Button label -> clip name, where they differ
+    button_width: int = 250
+    title_size: int = 36
+    fingerspell_names: bool = False  # Adds the name practice box of the alphabet page
+
+
+MODULES = {
+    'alphabet': ModuleManifest(
+        key='alphabet',
+        title="Learn ASL Alphabets",
+        card_image="assets/cards_image/alphabet.jpg",
+        card_color="#FF6B6B",
+        button_color="#FF7777",
+        asset_dir="assets/asl_videos",
+        rows=[[chr(i) for i in range(start, min(start + 6, 91))] for start in range(65, 91, 6)],
+        title_size=32,
+        fingerspell_names=True,
+    ),
+    'greetings': ModuleManifest(
+        key='greetings',
+        title="Greetings And Phrases",
+        card_image="assets/cards_image/greetings.jpg",
+        card_color="#4ECDC4",
+        button_color="#4DC5C9",
+        asset_dir="assets/greetings_videos",
+        rows=[
+            ["YES", "NO", "WHO", "WHY", "WHEN"],
+            ["WHICH", "WHITE", "HOW", "HELLO", "GOODBYE"],
+            ["NICE TO MEET YOU", "SEE YOU LATER", "WHAT'S UP", "GET OUT", "I LIKE YOU"],
+        ],
+        name_mapping={"WHAT'S UP": "whats up"},
+        button_width=300,
+    ),
+    'numbers': ModuleManifest(
+        key='numbers',
+        title="Numbers",
+        card_image="assets/cards_image/numbers.jpg",
+        card_color="#45B7D1",
+        button_color="#3FACD0",
+        asset_dir="assets/numbers_videos",
+        rows=[
+            ["0 (ZERO)", "1 (ONE)", "2 (TWO)", "3 (THREE)", "4 (FOUR)"],
+            ["5 (FIVE)", "6 (SIX)", "7 (SEVEN)", "8 (EIGHT)", "9 (NINE)"],
+        ],
+        name_mapping={f"{digit} ({word})": str(digit) for digit, word in enumerate(
+            ["ZERO", "ONE", "TWO", "THREE", "FOUR", "FIVE", "SIX", "SEVEN", "EIGHT", "NINE"]
+        )},
+        title_size=28,
+    ),
+    'days': ModuleManifest(
+        key='days',
+        title="Days of the Week",
+        card_image="assets/cards_image/days.jpg",
+        card_color="#96CEB4",
+        button_color="#A2C6C1",
+        asset_dir="assets/days_videos",
+        rows=[
+            ["SATURDAY", "SUNDAY", "MONDAY", "TUESDAY"],
+            ["WEDNESDAY", "THURSDAY", "FRIDAY"],
+        ],
+        title_size=28,
+    ),
+    'colours': ModuleManifest(
+        key='colours',
+        title="Colours",
+        card_image="assets/cards_image/colours.jpeg",
+        card_color="#D4A5A5",
+        button_color="#CBAEA9",
+        asset_dir="assets/colors_videos",
+        rows=[
+            ["RED", "BLUE", "GREEN", "YELLOW", "ORANGE"],
+            ["BLACK", "WHITE", "PURPLE", "PINK", "BROWN"],
+        ],
+    ),
+    'months': ModuleManifest(
+        key='months',
+        title="Months",
+        card_image="assets/cards_image/month.jpg",
+        card_color="#9B89B3",
+        button_color="#927CA3",
+        asset_dir="assets/months_videos",
+        rows=[
+            ["JAN", "FEB", "MAR", "APR"],
+            ["MAY", "JUN", "JUL", "AUG"],
+            ["SEP", "OCT", "NOV", "DEC"],
+        ],
+        name_mapping={
+            "JAN": "january", "FEB": "february", "MAR": "march", "APR": "april",
+            "MAY": "may", "JUN": "june", "JUL": "july", "AUG": "august",
+            "SEP": "september", "OCT": "october", "NOV": "november", "DEC": "december",
+        },
+        button_width=300,
+    ),
+}
@@ -0,0 +1,375 @@
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QGridLayout, QLabel, QFrame, QGraphicsDropShadowEffect, QStackedWidget
+)
+from PySide6.QtCore import Qt, QSize, QUrl
+from PySide6.QtGui import QIcon, QColor, QFont, QMovie, QPixmap, QImageReader
+from PySide6.QtMultimedia import QMediaPlayer
+from .assets import get_asset_registry
+from .media_pool import get_media_pool
+from .video_previews import cached_poster, cached_preview
+
+# Style sheets shared by every learning page, parsed once instead of per page
+HEADER_STYLE = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4B79A1, stop:1 #283E51);
+        border-radius: 20px;
+        padding: 20px;
+    }
+"""
+
+BACK_BUTTON_STYLE = """
+    QPushButton {
+        background-color: rgba(255, 255, 255, 0.15);
+        border-radius: 15px;
+        padding: 12px;
+        min-width: 45px;
+        min-height: 45px;
+    }
+    QPushButton:hover {
+        background-color: rgba(255, 255, 255, 0.25);
+    }
+    QPushButton:pressed {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+"""
+
+TITLE_STYLE = """
+    color: white;
+    margin-left: 20px;
+    text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.2);
+"""
+
+GRID_FRAME_STYLE = """
+    QFrame {
+        background-color: white;
+        border-radius: 25px;
+        padding: 20px;
+    }
+"""
+
+ITEM_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #ffffff;
+        border: 2px solid #e8e8e8;
+        border-radius: 20px;
+        color: #2c3e50;
+        padding: 15px;
+        text-align: center;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4B79A1, stop:1 #283E51);
+        color: white;
+        border: none;
+    }
+    QPushButton:pressed {
+        background-color: #2c3e50;
+    }
+"""
+
+POPUP_STYLE = """
+    QFrame {
+        background-color: white;
+        border-radius: 20px;
+        border: none;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+"""
+
+POPUP_TITLE_STYLE = """
+    font-size: 24px;
+    font-weight: bold;
+    color: #2c3e50;
+    margin: 10px;
+"""
+
+CLOSE_BUTTON_STYLE = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #e74c3c, stop:1 #c0392b);
+        color: white;
+        padding: 12px 25px;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 16px;
+        margin: 10px;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #c0392b, stop:1 #a93226);
+    }
+"""
+
+ERROR_POPUP_STYLE = """
+    QFrame {
+        background-color: white;
+        border-radius: 15px;
+        border: none;
+        box-shadow: 0 4px 6px rgba(231, 76, 60, 0.2);
+    }
+"""
+
+OK_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+"""
+
+class LearningModule(QWidget):
+    """A learning page built from a ModuleManifest: a grid of signs with a looping video popup"""
+
+    def __init__(self, manifest):
+        super().__init__()
+        self.manifest = manifest
+        self.pooled_players = []
+        self.sign_display = None
+        self.item_buttons = {}
+        self.init_ui()
+        self.setStyleSheet("background-color: #EEF2F7;")
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(40, 20, 40, 20)
+        main_layout.setSpacing(20)
+        main_layout.addWidget(self.create_header())
+        main_layout.addWidget(self.create_grid())
+
+    def create_header(self):
+        header_frame = QFrame()
+        header_frame.setFixedHeight(170)
+        header_frame.setStyleSheet(HEADER_STYLE)
+
+        header_layout = QHBoxLayout(header_frame)
+        header_layout.setContentsMargins(20, 10, 20, 10)
+
+        # Back button
+        back_button = QPushButton()
+        back_button.setIcon(QIcon("assets/back_arrow.png"))
+        back_button.setIconSize(QSize(24, 24))
+        back_button.setStyleSheet(BACK_BUTTON_STYLE)
+        back_button.clicked.connect(self.go_back)
+
+        # Header title
+        header_label = QLabel(self.manifest.title)
+        header_label.setFont(QFont("Segoe UI", self.manifest.title_size, QFont.Bold))
+        header_label.setStyleSheet(TITLE_STYLE)
+
+        header_layout.addWidget(back_button)
+        header_layout.addWidget(header_label)
+        header_layout.addStretch()
+        return header_frame
+
+    def create_grid(self):
+        grid_frame = QFrame()
+        grid_frame.setStyleSheet(GRID_FRAME_STYLE)
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(30)
+        shadow.setColor(QColor(0, 0, 0, 40))
+        shadow.setOffset(0, 5)
+        grid_frame.setGraphicsEffect(shadow)
+
+        grid_layout = QGridLayout(grid_frame)
+        grid_layout.setSpacing(15)
+
+        # Every button spans two columns, so a shorter row can be centred
+        # under the longer ones by starting it half a button in
+        width = max(len(items) for items in self.manifest.rows)
+        for row, items in enumerate(self.manifest.rows):
+            start_col = width - len(items)
+            for i, item in enumerate(items):
+                button = self.create_item_button(item)
+                grid_layout.addWidget(button, row, start_col + i * 2, 1, 2)
+
+        for i in range(width * 2):
+            grid_layout.setColumnStretch(i, 1)
+        return grid_frame
+
+    def create_item_button(self, item):
+        button = QPushButton(item)
+        button.setFixedSize(self.manifest.button_width, 150)
+        button.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        button.setStyleSheet(ITEM_BUTTON_STYLE)
+
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(20)
+        shadow.setColor(QColor(0, 0, 0, 25))
+        shadow.setOffset(0, 4)
+        button.setGraphicsEffect(shadow)
+
+        button.clicked.connect(lambda checked=False, item=item: self.show_sign(item))
+        self.item_buttons[item] = button
+        return button
+
+    def showEvent(self, event):
+        self.update_poster_tooltips()
+        super().showEvent(event)
+
+    def update_poster_tooltips(self):
+        """Show each sign's poster frame when hovering its button, once it has been indexed"""
+        for item, button in self.item_buttons.items():
+            if button.toolTip():
+                continue
+            video_path = self.get_video_path(item)
+            poster = cached_poster(video_path) if video_path else None
+            if poster:
+                button.setToolTip(f'<img src="{QUrl.fromLocalFile(poster).toString()}" width="200">')
+
+    def hideEvent(self, event):
+        # The page is kept for the next visit; its players go back to the
+        # pool as soon as it leaves the screen. Minimising the window is
+        # left alone.
+        if not event.spontaneous():
+            self.close_video()
+        super().hideEvent(event)
+
+    def go_back(self):
+        main_window = self.window()
+        main_window.content_area.setCurrentIndex(4)  # Return to learning section
+
+    def get_video_path(self, item):
+        name = self.manifest.name_mapping.get(item, item)
+        return get_asset_registry().find(self.manifest.asset_dir, name)
+
+    def show_sign(self, item):
+        # Close any existing video display
+        if self.sign_display:
+            self.close_video()
+
+        video_path = self.get_video_path(item)
+        if not video_path:
+            self.show_error_popup(f"Video for {item} not found")
+            return
+
+        self.create_video_display(f"Learning: {item}", video_path)
+        self.play_video(video_path)
+
+    def create_popup(self, title):
+        """Show the video popup, returning its layout for the video surface to go in"""
+        self.sign_display = QFrame(self)
+        self.sign_display.setStyleSheet(POPUP_STYLE)
+
+        layout = QVBoxLayout(self.sign_display)
+        title_label = QLabel(title)
+        title_label.setStyleSheet(POPUP_TITLE_STYLE)
+        title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title_label)
+
+        # Position and show the pop-up
+        self.sign_display.setFixedSize(500, 600)
+        self.sign_display.move(
+            self.width()//2 - self.sign_display.width()//2,
+            self.height()//2 - self.sign_display.height()//2
+        )
+        return layout
+
+    def add_close_button(self, layout):
+        control_layout = QHBoxLayout()
+        close_button = QPushButton("Close")
+        close_button.setStyleSheet(CLOSE_BUTTON_STYLE)
+        close_button.clicked.connect(self.close_video)
+        control_layout.addWidget(close_button)
+        layout.addLayout(control_layout)
+
+    def create_video_display(self, title, video_path):
+        layout = self.create_popup(title)
+
+        # Video widget, borrowed from the shared player pool
+        pooled = get_media_pool().acquire()
+        self.pooled_players = [pooled]
+        self.media_player = pooled.player
+        self.audio_output = pooled.audio_output
+        self.video_widget = pooled.video_widget
+
+        # The clip's preview stands in for the video until the player has
+        # buffered it, so the popup never opens on a blank surface
+        self.video_area = QStackedWidget()
+        self.video_area.setMinimumSize(400, 400)
+        preview_label = self.create_preview_label(video_path)
+        if preview_label:
+            self.video_area.addWidget(preview_label)
+        self.video_area.addWidget(self.video_widget)
+        layout.addWidget(self.video_area)
+
+        self.add_close_button(layout)
+        self.sign_display.show()
+
+    def create_preview_label(self, video_path):
+        """A label playing the clip's animated preview, or showing its poster, if indexed"""
+        preview = cached_preview(video_path)
+        poster = cached_poster(video_path)
+        if not preview and not poster:
+            return None
+        label = QLabel()
+        label.setAlignment(Qt.AlignCenter)
+        if preview:
+            movie = QMovie(preview, parent=label)
+            size = QImageReader(preview).size()
+            size.scale(400, 400, Qt.KeepAspectRatio)
+            movie.setScaledSize(size)
+            label.setMovie(movie)
+            movie.start()
+        else:
+            label.setPixmap(QPixmap(poster).scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        return label
+
+    def show_video_surface(self):
+        if self.sign_display and self.video_area.currentWidget() is not self.video_widget:
+            self.video_area.setCurrentWidget(self.video_widget)
+
+    def play_video(self, video_path):
+        self.media_player.setSource(QUrl.fromLocalFile(video_path))
+        self.pooled_players[0].connect(self.media_player.mediaStatusChanged, self.handle_media_status)
+        # The backend wraps around by itself, without a seek round trip
+        # through the event loop at the end of every pass
+        self.media_player.setLoops(QMediaPlayer.Loops.Infinite)
+        self.media_player.play()
+
+    def replay_video(self):
+        self.media_player.setPosition(0)
+        self.media_player.play()
+
+    def handle_media_status(self, status):
+        if status in (QMediaPlayer.MediaStatus.BufferedMedia, QMediaPlayer.MediaStatus.EndOfMedia):
+            self.show_video_surface()
+
+    def close_video(self):
+        # Hand the players back before the popup holding their surfaces is deleted
+        for pooled in self.pooled_players:
+            get_media_pool().release(pooled)
+        self.pooled_players = []
+
+        if self.sign_display:
+            if not self.sign_display.isHidden():
+                self.sign_display.deleteLater()
+            self.sign_display = None
+
+    def show_error_popup(self, message):
+        error_popup = QFrame(self)
+        error_popup.setStyleSheet(ERROR_POPUP_STYLE)
+
+        layout = QVBoxLayout(error_popup)
+
+        error_label = QLabel(message)
+        error_label.setAlignment(Qt.AlignCenter)
+
+        ok_button = QPushButton("OK")
+        ok_button.setStyleSheet(OK_BUTTON_STYLE)
+        ok_button.clicked.connect(error_popup.deleteLater)
+
+        layout.addWidget(error_label)
+        layout.addWidget(ok_button)
+
+        error_popup.setFixedSize(300, 150)
+        error_popup.move(
+            self.width()//2 - error_popup.width()//2,
+            self.height()//2 - error_popup.height()//2
+        )
+        error_popup.show()
@@ -7,6 +7,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 from .lessons.beginner_mode import BeginnerMode
 from .lessons.intermediate_mode import IntermediateMode
+from .image_cache import load_pixmap
 
 class QuizUI(QWidget):
     def __init__(self):
@@ -123,14 +124,9 @@ class QuizUI(QWidget):
         image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         image_label.setAlignment(Qt.AlignCenter)
 
-        pixmap = QPixmap(mode_info["image"])
+        pixmap = load_pixmap(mode_info["image"], 1200, 270)
         if not pixmap.isNull():
-            scaled_pixmap = pixmap.scaled(
-                1200, 270,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            image_label.setPixmap(scaled_pixmap)
+            image_label.setPixmap(pixmap)
 
 
         image_layout.addWidget(image_label)
@@ -7,6 +7,8 @@ from PySide6.QtCore import QUrl, QPropertyAnimation, QEasingCurve
 from PySide6.QtCore import QPoint
 import random
 
+from ui.image_cache import load_pixmap
+
 class BeginnerMode(QWidget):
     def __init__(self):
 
@@ -369,8 +371,7 @@ class BeginnerMode(QWidget):
         self.start_timer()
         self.current_letter = random.choice(self.letters)
         image_path = f"assets/asl_images/{self.current_letter.lower()}.png"
-        pixmap = QPixmap(image_path)
-        self.image_label.setPixmap(pixmap.scaled(450, 450, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.image_label.setPixmap(load_pixmap(image_path, 450, 450))
         
         choices = [self.current_letter]
         while len(choices) < 4:
@@ -11,6 +11,8 @@ from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QSizePolicy
 from PySide6.QtCore import QSize
 
+from ui.assets import get_asset_registry
+
 class IntermediateMode(QWidget):
     stats_updated = Signal(dict)
     def __init__(self):
@@ -466,18 +468,11 @@ class IntermediateMode(QWidget):
         self.media_player.setVideoOutput(self.video_widget)
         self.media_player.setAudioOutput(self.audio_output)
         self.audio_output.setVolume(0.7)
-
-        self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        self.media_player.setLoops(QMediaPlayer.Loops.Infinite)  # Loop each gesture without re-seeking
         
         self.play_button.clicked.connect(self.play_video)
         self.media_player.errorOccurred.connect(self.handle_media_error)
 
-    def handle_media_status(self, status):
-        """Handle media status changes to implement looping."""
-        if status == QMediaPlayer.EndOfMedia:
-            self.media_player.setPosition(0)  # Reset to beginning
-            self.media_player.play()  # Start playing again
-
     def setup_sounds(self):
         """Initialize sound effects."""
         self.correct_sound = QSoundEffect()
@@ -879,9 +874,9 @@ class IntermediateMode(QWidget):
         remaining_gestures = [g for g in available_gestures if g != self.current_gesture]
         self.current_gesture = random.choice(remaining_gestures if remaining_gestures else available_gestures)
         
-        video_path = os.path.join("assets", "gesture_videos", f"{self.current_gesture}.mp4")
-        if not os.path.exists(video_path):
-            print(f"Video file not found: {video_path}")
+        video_path = get_asset_registry().find("assets/gesture_videos", self.current_gesture)
+        if not video_path:
+            print(f"Video file not found for gesture: {self.current_gesture}")
             return
         
         # Set up new video with smooth transition
@@ -1140,7 +1135,7 @@ class IntermediateMode(QWidget):
         self.media_player.setVideoOutput(self.video_widget)
         self.media_player.setAudioOutput(self.audio_output)
         self.audio_output.setVolume(0.7)
-        self.media_player.mediaStatusChanged.connect(self.handle_media_status)
+        self.media_player.setLoops(QMediaPlayer.Loops.Infinite)
         self.media_player.errorOccurred.connect(self.handle_media_error)
 
 
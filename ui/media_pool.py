@@ -0,0 +1,80 @@
+from PySide6.QtCore import QObject, QUrl
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PySide6.QtMultimediaWidgets import QVideoWidget
+
+# Creating a QMediaPlayer starts a new multimedia backend pipeline, which is
+# slow and, if the popup holding it is not torn down cleanly, leaks. The
+# learning modules borrow players from this pool instead: each one comes
+# with its audio output and video surface already attached, so showing a
+# sign costs a setSource.
+
+MAX_IDLE_PLAYERS = 2
+
+_pool = None
+
+
+class PooledPlayer:
+    """A media player bound to its own audio output and video widget"""
+
+    def __init__(self):
+        self.player = QMediaPlayer()
+        self.audio_output = QAudioOutput()
+        self.video_widget = QVideoWidget()
+        self.player.setAudioOutput(self.audio_output)
+        self.player.setVideoOutput(self.video_widget)
+        self.connections = []
+
+    def connect(self, signal, slot):
+        """Connect one of the player's signals, to be undone when it is released"""
+        self.connections.append(signal.connect(slot))
+
+    def reset(self):
+        """Stop playback and drop everything a previous user attached"""
+        self.player.stop()
+        self.player.setSource(QUrl())
+        self.player.setLoops(1)
+        self.player.setPlaybackRate(1.0)
+        # Disconnect by handle: signal.disconnect() returns a bool whose
+        # refcount it gets wrong, which crashes the interpreter after enough
+        # releases
+        for connection in self.connections:
+            QObject.disconnect(connection)
+        self.connections = []
+        # Detach the surface so deleting the popup it sat in leaves it alive
+        self.video_widget.hide()
+        self.video_widget.setParent(None)
+        self.video_widget.setMinimumSize(0, 0)
+
+
+class MediaPlayerPool:
+    """Hands out warmed players and takes them back when a popup closes"""
+
+    def __init__(self, max_idle: int = MAX_IDLE_PLAYERS):
+        self.max_idle = max_idle
+        self.idle = []
+
+    def warm(self, count: int = 1):
+        """Create players ahead of the first request"""
+        while len(self.idle) < min(count, self.max_idle):
+            self.idle.append(PooledPlayer())
+
+    def acquire(self) -> PooledPlayer:
+        """A player whose video widget is hidden and unparented, for the caller to place"""
+        return self.idle.pop() if self.idle else PooledPlayer()
+
+    def release(self, pooled: PooledPlayer):
+        pooled.reset()
+        if len(self.idle) < self.max_idle:
+            self.idle.append(pooled)
+        else:
+            pooled.video_widget.deleteLater()
+            pooled.player.deleteLater()
+            pooled.audio_output.deleteLater()
+
+
+def get_media_pool() -> MediaPlayerPool:
+    """Process-wide player pool, created on first use (GUI thread only)"""
+    global _pool
+    if _pool is None:
+        _pool = MediaPlayerPool()
+    return _pool
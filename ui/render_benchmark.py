@@ -0,0 +1,103 @@
+"""Compare text-to-sign render profiles.
+
+Renders a fixed corpus of sentences with each profile and reports wall time
+and output size. Every pass starts from an empty segment cache, so the
+times are of real encodes rather than cache hits:
+
+    python -m ui.render_benchmark
+    python -m ui.render_benchmark --profiles interactive archive --repeat 3
+"""
+
+# Standard library imports
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from ui.render_profiles import PROFILES, get_profile
+from ui.segment_cache import SegmentCache
+from ui.sign_render import text_to_sign, load_dataset, DATASET_PATH
+
+CORPUS = [
+    "hello",
+    "thank you",
+    "good morning how are you",
+    "my name is sam",
+    "please help me find the book",
+    "we are going to school tomorrow",
+]
+
+
+def benchmark_profile(profile, corpus, dataset, dataset_path, work_dir, repeat=1) -> dict:
+    """Render every sentence with one profile, returning totals"""
+    seconds = 0.0
+    size = 0
+    failed = 0
+    for run in range(repeat):
+        # A fresh cache per pass: sentences within a pass still share
+        # segments, as they would in the app
+        cache_dir = os.path.join(work_dir, f"segments_{profile.name}_{run}")
+        segment_cache = SegmentCache(cache_dir)
+        for i, text in enumerate(corpus):
+            output_path = os.path.join(work_dir, f"{profile.name}_{run}_{i}.{profile.container}")
+            start = time.perf_counter()
+            try:
+                result = text_to_sign(text, dataset, dataset_path, output_path=output_path, profile=profile,
+                                      segment_cache=segment_cache)
+            except Exception as e:
+                print(f"Warning: {profile.name} failed on {text!r}: {e}")
+                result = None
+            seconds += time.perf_counter() - start
+            if result and os.path.exists(result):
+                size += os.path.getsize(result)
+                os.remove(result)
+            else:
+                failed += 1
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    renders = len(corpus) * repeat
+    return {
+        'profile': profile.name,
+        'seconds': seconds / repeat,
+        'per_sentence': seconds / renders,
+        'bytes': size // repeat,
+        'failed': failed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui.render_benchmark", description="Render time and size per profile")
+    parser.add_argument('--dataset', default=DATASET_PATH, help="Directory of sign clips")
+    parser.add_argument('--profiles', nargs='+', default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument('--repeat', type=int, default=1, help="Times to render the corpus per profile")
+    args = parser.parse_args(argv)
+
+    dataset = load_dataset(args.dataset)
+    work_dir = tempfile.mkdtemp(prefix="sign_benchmark_")
+    try:
+        # Warm the shared process pool and letter cache so the first
+        # profile is not charged for start-up, without touching the
+        # segment cache the app uses
+        text_to_sign(CORPUS[0], dataset, args.dataset,
+                     output_path=os.path.join(work_dir, "warmup.mp4"), profile=get_profile('mobile'),
+                     segment_cache=SegmentCache(os.path.join(work_dir, "segments_warmup")))
+
+        print(f"{len(CORPUS)} sentences, {args.repeat} run(s) per profile")
+        print(f"{'profile':<12} {'size':>9} {'fps':>4} {'wall s':>8} {'s/sentence':>11} {'output KiB':>11}")
+        for name in args.profiles:
+            profile = get_profile(name)
+            result = benchmark_profile(profile, CORPUS, dataset, args.dataset, work_dir, args.repeat)
+            width, height = profile.size
+            line = (f"{name:<12} {f'{width}x{height}':>9} {profile.fps:>4} {result['seconds']:>8.2f} "
+                    f"{result['per_sentence']:>11.2f} {result['bytes'] / 1024:>11.1f}")
+            if result['failed']:
+                line += f"  ({result['failed']} failed)"
+            print(line)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
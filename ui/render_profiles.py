@@ -0,0 +1,46 @@
+# Standard library imports
+import hashlib
+from typing import List, NamedTuple, Tuple
+
+
+class RenderProfile(NamedTuple):
+    """Output size, frame rate and encoder settings for a text-to-sign render"""
+    name: str
+    size: Tuple[int, int]
+    fps: int
+    preset: str
+    crf: int
+    container: str
+
+    def encoder_args(self) -> List[str]:
+        return ['-c:v', 'libx264', '-preset', self.preset, '-crf', str(self.crf)]
+
+    @property
+    def cache_namespace(self) -> str:
+        """Directory name for this profile's cached output.
+
+        Includes a digest of the settings so changing a profile never serves
+        files rendered with the old ones.
+        """
+        digest = hashlib.sha1(repr(tuple(self)).encode('utf-8')).hexdigest()[:8]
+        return f"{self.name}-{digest}"
+
+
+PROFILES = {
+    # The original fixed settings
+    'standard': RenderProfile('standard', (640, 480), 30, 'medium', 23, 'avi'),
+    # Fast turnaround for the Text-to-Sign tab
+    'interactive': RenderProfile('interactive', (480, 360), 30, 'ultrafast', 26, 'mp4'),
+    # Best quality for pre-generated lesson material
+    'archive': RenderProfile('archive', (640, 480), 30, 'slow', 18, 'mp4'),
+    # Small files for phones and slow links
+    'mobile': RenderProfile('mobile', (320, 240), 24, 'fast', 28, 'mp4'),
+}
+DEFAULT_PROFILE = 'standard'
+
+
+def get_profile(name: str = DEFAULT_PROFILE) -> RenderProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown render profile '{name}', expected one of: {', '.join(PROFILES)}")
@@ -0,0 +1,321 @@
+"""Headless text-to-sign rendering.
+
+Renders without the TTS window, either once from the command line or as a
+small local HTTP service that queues jobs:
+
+    python -m ui.render_service render "hello world" --batch lesson.txt
+    python -m ui.render_service --profile mobile serve --port 8765
+
+Nothing on this path imports Qt.
+"""
+
+# Standard library imports
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from ui.render_profiles import PROFILES, DEFAULT_PROFILE, get_profile
+from ui.sign_render import text_to_sign, stream_text_to_sign, load_dataset, timing_path, DATASET_PATH, GAP_DURATION
+from ui.transitions import TRANSITIONS, DEFAULT_TRANSITION
+
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "text-to-sign", "cache"
+)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse case and whitespace so identical requests share one job"""
+    return ' '.join(text.lower().split())
+
+
+class RenderJob:
+    def __init__(self, job_id: str, text: str, output_path: str):
+        self.id = job_id
+        self.text = text
+        self.output_path = output_path
+        self.status = 'queued'
+        self.error = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'text': self.text,
+            'status': self.status,
+            'output_path': self.output_path if self.status == 'done' else None,
+            'timing_path': timing_path(self.output_path) if self.status == 'done' else None,
+            'error': self.error,
+            'render_seconds': round(self.finished - self.started, 3) if self.started and self.finished else None,
+        }
+
+
+class RenderService:
+    """Queues text-to-sign jobs and renders them with a bounded worker pool.
+
+    Jobs are keyed by their normalized text and render profile, so a
+    repeated request returns the existing job, and a render already in the
+    profile's cache namespace completes immediately.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, dataset_path: str = DATASET_PATH, workers: int = 2,
+                 profile: str = DEFAULT_PROFILE, streaming: bool = False,
+                 gap: float = GAP_DURATION, transition: str = DEFAULT_TRANSITION):
+        self.profile = get_profile(profile)
+        self.streaming = streaming
+        self.gap = gap
+        # The streaming renderer only separates signs with blank gaps
+        self.transition = 'blank' if streaming else transition
+        self.cache_dir = os.path.join(cache_dir, self.profile.cache_namespace)
+        self.dataset_path = dataset_path
+        self.dataset = load_dataset(dataset_path)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render")
+        self.jobs: Dict[str, RenderJob] = {}
+        self.lock = threading.Lock()
+        self.counters = {'submitted': 0, 'deduplicated': 0, 'cache_hits': 0, 'rendered': 0, 'failed': 0}
+        self.first_start = None
+        self.last_finish = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def job_key(self, text: str) -> str:
+        renderer = 'streaming' if self.streaming else 'segmented'
+        settings = f"{self.profile.cache_namespace}\n{renderer}\n{self.transition}:{self.gap:g}"
+        key = f"{self.dataset_path}\n{settings}\n{normalize_text(text)}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+    def submit(self, text: str) -> RenderJob:
+        job_id = self.job_key(text)
+        with self.lock:
+            self.counters['submitted'] += 1
+            job = self.jobs.get(job_id)
+            if job and job.status != 'failed':
+                self.counters['deduplicated'] += 1
+                return job
+
+            job = RenderJob(job_id, text, os.path.join(self.cache_dir, f"{job_id}.{self.profile.container}"))
+            self.jobs[job_id] = job
+            if os.path.exists(job.output_path):
+                job.status = 'done'
+                self.counters['cache_hits'] += 1
+                return job
+
+            job.future = self.executor.submit(self._render, job)
+            return job
+
+    def get(self, job_id: str) -> Optional[RenderJob]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def forget(self, job: RenderJob):
+        """Drop a job whose output has gone, so the next request for its text renders it again"""
+        with self.lock:
+            if self.jobs.get(job.id) is job:
+                del self.jobs[job.id]
+
+    def describe(self, job: RenderJob) -> dict:
+        """A consistent snapshot of a job, taken under the lock its worker updates it with"""
+        with self.lock:
+            return job.to_dict()
+
+    def wait(self, jobs: List[RenderJob]):
+        wait([job.future for job in jobs if job.future])
+
+    def _render(self, job: RenderJob):
+        with self.lock:
+            job.status = 'running'
+            job.started = time.time()
+            if self.first_start is None:
+                self.first_start = job.started
+
+        # Render next to the final name and move it in place when complete,
+        # so the cache never holds a partial file
+        root, extension = os.path.splitext(job.output_path)
+        partial_path = f"{root}.part{extension}"
+        status, error = 'failed', None
+        try:
+            if self.streaming:
+                output_path = stream_text_to_sign(job.text, self.dataset, self.dataset_path,
+                                                  output_path=partial_path, profile=self.profile, gap=self.gap)
+            else:
+                output_path = text_to_sign(job.text, self.dataset, self.dataset_path,
+                                           output_path=partial_path, profile=self.profile,
+                                           gap=self.gap, transition=self.transition)
+            if output_path:
+                if os.path.exists(timing_path(output_path)):
+                    os.replace(timing_path(output_path), timing_path(job.output_path))
+                os.replace(output_path, job.output_path)
+                status = 'done'
+            else:
+                error = "Nothing to render"
+        except Exception as e:
+            error = str(e)
+        finally:
+            with self.lock:
+                job.status = status
+                job.error = error
+                job.finished = time.time()
+                self.counters['rendered' if status == 'done' else 'failed'] += 1
+                self.last_finish = job.finished
+
+    def stats(self) -> dict:
+        with self.lock:
+            stats = dict(self.counters)
+            elapsed = (self.last_finish - self.first_start) if self.first_start and self.last_finish else 0.0
+            stats['queued'] = sum(1 for job in self.jobs.values() if job.status in ('queued', 'running'))
+            stats['elapsed_seconds'] = round(elapsed, 3)
+            stats['jobs_per_sec'] = round(stats['rendered'] / elapsed, 3) if elapsed else 0.0
+            return stats
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """JSON API: POST /jobs, GET /jobs/<id>, GET /jobs/<id>/video, GET /stats"""
+
+    service: RenderService = None
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != '/jobs':
+            self._send_json(404, {'error': 'Not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send_json(400, {'error': 'Invalid JSON'})
+            return
+
+        if not isinstance(request, dict):
+            self._send_json(400, {'error': "Expected a JSON object"})
+            return
+        texts = request['texts'] if 'texts' in request else [request.get('text')]
+        if (not isinstance(texts, list) or not texts
+                or not all(isinstance(text, str) and text.strip() for text in texts)):
+            self._send_json(400, {'error': "Expected 'text' or a list of 'texts', all non-empty strings"})
+            return
+
+        jobs = [self.service.submit(text) for text in texts]
+        self._send_json(202, {'jobs': [self.service.describe(job) for job in jobs]})
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.service.stats())
+            return
+
+        match = re.fullmatch(r'/jobs/([0-9a-f]+)(/video)?', self.path)
+        job = self.service.get(match.group(1)) if match else None
+        if not job:
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        info = self.service.describe(job)
+        if not match.group(2):
+            self._send_json(200, info)
+        elif info['status'] != 'done':
+            self._send_json(409, {'error': f"Job is {info['status']}"})
+        else:
+            try:
+                with open(job.output_path, 'rb') as file:
+                    data = file.read()
+            except OSError:
+                # Removed from the cache directory since it was rendered
+                self.service.forget(job)
+                self._send_json(410, {'error': "Video is no longer available, submit the text again"})
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'video/mp4' if job.output_path.endswith('.mp4') else 'video/x-msvideo')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(service: RenderService, host: str, port: int):
+    RenderRequestHandler.service = service
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    print(f"Rendering service listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def read_batch(path: str) -> List[str]:
+    """One text per non-empty line"""
+    with open(path, encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui.render_service", description="Render text to sign language video without the UI")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="Directory for rendered videos")
+    parser.add_argument('--dataset', default=DATASET_PATH, help="Directory of sign clips")
+    parser.add_argument('--workers', type=int, default=2, help="Renders to run at the same time")
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=list(PROFILES), help="Render quality profile")
+    parser.add_argument('--streaming', action='store_true',
+                        help="Decode one clip at a time into a single encoder, for long texts or low memory")
+    parser.add_argument('--gap', type=float, default=GAP_DURATION, help="Seconds between signs")
+    parser.add_argument('--transition', default=DEFAULT_TRANSITION, choices=TRANSITIONS,
+                        help="How signs are separated (blank only with --streaming)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    render_parser = commands.add_parser('render', help="Render texts and exit")
+    render_parser.add_argument('texts', nargs='*', help="Texts to render")
+    render_parser.add_argument('--batch', help="File with one text per line")
+
+    serve_parser = commands.add_parser('serve', help="Run the local HTTP service")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8765)
+
+    args = parser.parse_args(argv)
+    service = RenderService(args.cache_dir, args.dataset, args.workers, args.profile, args.streaming,
+                            args.gap, args.transition)
+
+    if args.command == 'serve':
+        serve(service, args.host, args.port)
+        return 0
+
+    texts = list(args.texts) + (read_batch(args.batch) if args.batch else [])
+    if not texts:
+        parser.error("nothing to render")
+
+    jobs = [service.submit(text) for text in texts]
+    service.wait(jobs)
+    service.shutdown()
+
+    for job in dict.fromkeys(jobs):
+        result = job.output_path if job.status == 'done' else f"failed: {job.error}"
+        print(f"{job.id}  {result}  <- {job.text!r}")
+    stats = service.stats()
+    print(f"{stats['rendered']} rendered, {stats['cache_hits']} cached, {stats['deduplicated']} deduplicated, "
+          f"{stats['failed']} failed, {stats['jobs_per_sec']} jobs/sec")
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# Standard library imports
+import hashlib
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, Optional
+
+# Each sign in a sentence is encoded as its own segment with the settings of
+# the render profile, so segments can be joined with a stream copy. Keeping
+# them on disk between renders means that editing one word of a sentence
+# only encodes the segments that changed; the rest are re-muxed as they are.
+
+SEGMENT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "text-to-sign", "cache", "segments"
+)
+SEGMENT_CACHE_LIMIT = 512 * 1024 * 1024
+SEGMENT_FORMAT_VERSION = 1  # Bump when the way segments are encoded changes
+PARTIAL_MAX_AGE = 3600  # Unfinished segments older than this are abandoned
+PRUNE_MIN_AGE = 300  # Segments used more recently than this are never pruned
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+class SegmentCache:
+    """Encoded segments keyed by what they show, one directory per render profile"""
+
+    def __init__(self, root: str = SEGMENT_CACHE_DIR, max_bytes: int = SEGMENT_CACHE_LIMIT,
+                 min_age: float = PRUNE_MIN_AGE):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.min_age = min_age
+        self.hits = 0
+        self.misses = 0
+        self._durations: Dict[str, float] = {}
+        # Segments held by renders in progress, with how many renders hold each
+        self._pins: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, profile, kind: str, source, gap: float, settings=()) -> str:
+        """Final cache path of a segment.
+
+        Clips are identified by path, size and modification time, so a
+        replaced dataset clip is re-encoded. settings holds anything else
+        that changes the output, such as the fingerspelling sprite format.
+        """
+        if kind == 'clip':
+            stat = os.stat(source)
+            identity = (os.path.abspath(source), stat.st_size, stat.st_mtime_ns)
+        else:
+            identity = tuple(source)
+        key = repr((SEGMENT_FORMAT_VERSION, kind, identity, round(gap, 3), tuple(settings)))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, profile.cache_namespace, digest[:2], f"{digest}.mp4")
+
+    def lookup(self, path: str) -> Optional[str]:
+        """Return the cached segment if present, marking it recently used"""
+        if os.path.exists(path):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            with self._lock:
+                self.hits += 1
+            return path
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def partial_path(self, path: str) -> str:
+        """Unique name to encode a segment to before it is stored"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return f"{path[:-len('.mp4')]}.{uuid.uuid4().hex[:8]}.part.mp4"
+
+    def store(self, partial_path: Optional[str], path: str) -> Optional[str]:
+        """Move a finished segment into place, returning its cache path"""
+        if not partial_path:
+            return None
+        os.replace(partial_path, path)
+        return path
+
+    def duration(self, path: str, probe) -> float:
+        """Segment duration, probed once per process since segments never change"""
+        with self._lock:
+            if path in self._durations:
+                return self._durations[path]
+        duration = probe(path)
+        with self._lock:
+            self._durations[path] = duration
+        return duration
+
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+    def pin(self, paths: Iterable[str]):
+        """Keep segments from being pruned until they are unpinned"""
+        with self._lock:
+            for path in paths:
+                self._pins[path] = self._pins.get(path, 0) + 1
+
+    def unpin(self, paths: Iterable[str]):
+        with self._lock:
+            for path in paths:
+                count = self._pins.get(path, 0) - 1
+                if count > 0:
+                    self._pins[path] = count
+                else:
+                    self._pins.pop(path, None)
+
+    def prune(self):
+        """Drop least recently used segments beyond the size limit, and abandoned partials.
+
+        Several renders can share the cache at once, so segments that are
+        pinned, or were used in the last min_age seconds, are kept even
+        over the limit: another render may have looked them up and not
+        joined them yet.
+        """
+        files = []
+        now = time.time()
+        with self._lock:
+            pinned = set(self._pins)
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith('.part.mp4'):
+                    if now - stat.st_mtime > PARTIAL_MAX_AGE:
+                        self._remove(path)
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in sorted(files):
+            if total <= self.max_bytes or now - mtime < self.min_age:
+                break
+            if path in pinned:
+                continue
+            self._remove(path)
+            total -= size
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._durations.pop(path, None)
+
+
+def get_segment_cache() -> SegmentCache:
+    """Process-wide segment cache, created on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SegmentCache()
+        return _cache
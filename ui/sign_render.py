@@ -0,0 +1,702 @@
+# Standard library imports
+import glob
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+# Third-party imports
+from moviepy.config import get_setting
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from ui.compositor import FrameCompositor
+from ui.fingerspelling import get_fingerspelling_cache
+from ui.gloss import match_vocabulary, tag_words
+from ui.render_profiles import RenderProfile, get_profile
+from ui.assets import get_asset_registry
+from ui.segment_cache import SegmentCache, get_segment_cache
+from ui.transitions import DEFAULT_TRANSITION, TransitionLibrary, get_transition_library
+
+# Nothing in this module may import Qt: it runs inside worker processes and
+# must stay cheap to import there.
+
+DATASET_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "text-to-sign", "Dataset", "simplified_dataset"
+)
+GAP_DURATION = 0.3
+READ_AHEAD = max(2, os.cpu_count() or 1)  # Clips prepared ahead of the one being joined
+# Playback speeds that get their own pre-rendered variant; the player only
+# makes up the small difference to the slider value
+SPEED_BUCKETS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+
+logger = logging.getLogger(__name__)
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render when a newer request has superseded it"""
+
+
+# Helper functions
+def parse_string(string, dataset, spans=None):
+    """Split text into dataset glosses, with unknown words as lists of letters.
+
+    If a list is passed as spans, the (first, last + 1) word indices each
+    item was made from are appended to it, or None for items not taken
+    from the text.
+    """
+    dataset_lower = [d.lower() for d in dataset]
+    case_mapping = dict(zip(dataset_lower, dataset))
+    vocabulary = frozenset(dataset_lower)
+
+    # Identify sentence type
+    sentence_type = 'statement'
+    if '?' in string:
+        sentence_type = 'question'
+    elif '!' in string:
+        sentence_type = 'exclamation'
+
+    # Clean and normalize input
+    string = string.lower().strip()
+
+    # Split into words and process each word
+    words = string.split()
+    result = []
+    i = 0
+    pos_tags = None
+
+    # Add sentence type indicator
+    if sentence_type == 'question' and 'question' in dataset_lower:
+        result.append(case_mapping['question'])
+    elif sentence_type == 'exclamation' and 'exclamation' in dataset_lower:
+        result.append(case_mapping['exclamation'])
+    if spans is not None:
+        spans.extend([None] * len(result))
+
+    while i < len(words):
+        # Check if the word is a number
+        if words[i].isdigit() and int(words[i]) < 10:
+            result.append(words[i])  # Directly use the number for video filename
+            if spans is not None:
+                spans.append((i, i + 1))
+            i += 1
+            continue
+
+        # Try matching phrases
+        phrase_found = False
+        for j in range(len(words), i, -1):
+            phrase = ' '.join(words[i:j])
+            clean_phrase = phrase.replace('?', '').replace('!', '')
+            if clean_phrase in dataset_lower:
+                result.append(case_mapping[clean_phrase])
+                if spans is not None:
+                    spans.append((i, j))
+                i = j
+                phrase_found = True
+                break
+
+        if not phrase_found:
+            # Handle individual words or letters
+            word = words[i].replace('?', '').replace('!', '')
+            if word in dataset_lower:
+                result.append(case_mapping[word])
+            else:
+                # Try the lemma or a synonym before falling back to
+                # fingerspelling; the sentence is tagged at most once
+                if pos_tags is None:
+                    pos_tags = tag_words(words)
+                gloss = match_vocabulary(word, pos_tags[i], vocabulary) if word.isalpha() else None
+                if gloss:
+                    result.append(case_mapping[gloss])
+                else:
+                    # Break into individual letters, kept together as one
+                    # fingerspelled item
+                    result.append([case_mapping[letter] for letter in word if letter in dataset_lower])
+            if spans is not None:
+                spans.append((i, i + 1))
+            i += 1
+
+    return result
+
+def remove_empty_values(lst):
+    return [x for x in lst if x]
+
+def flatten_lists(lst):
+    flat_list = []
+    for i in lst:
+        if isinstance(i, list):
+            flat_list.extend(flatten_lists(i))
+        else:
+            flat_list.append(i)
+    return flat_list
+
+def load_dataset(dataset_path: str = DATASET_PATH) -> List[str]:
+    """Return the gloss names available in a dataset directory, listing it afresh"""
+    if not os.path.isdir(dataset_path):
+        print(f"Warning: sign dataset not found at {dataset_path}, every word will be fingerspelled")
+    get_asset_registry().refresh(dataset_path)
+    return [os.path.splitext(os.path.basename(video))[0].replace('-', ' ').lower()
+            for video in get_asset_registry().files(dataset_path)]
+
+def find_video(word: str, videos_path: str) -> Optional[str]:
+    """Return the clip for a gloss, trying the dataset's filename formats"""
+    return get_asset_registry().find(videos_path, [word, word.replace(' ', '-'), word.replace(' ', '')])
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Shared pool for clip preparation, started on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _process_pool
+
+def prepare_segment(video_path: str, output_path: str, profile: RenderProfile, gap: float = 0.0) -> str:
+    """Decode one clip, scale it to the profile's size and pad it with a gap.
+
+    Runs in a worker process. Every segment is encoded with identical
+    parameters so the results can be joined without re-encoding.
+    """
+    compositor = FrameCompositor(output_path, profile.size, profile.fps, profile.encoder_args())
+    try:
+        compositor.add_clip(video_path)
+        if gap:
+            compositor.add_gap(gap)
+    except Exception:
+        compositor.abort()
+        raise
+    return compositor.close()
+
+def concat_segments(segment_paths: List[str], output_path: str):
+    """Join identically encoded segments with a stream copy"""
+    list_path = output_path + ".txt"
+    with open(list_path, 'w', encoding='utf-8') as file:
+        for path in segment_paths:
+            file.write(f"file '{os.path.abspath(path)}'\n")
+    # Put the index up front so MP4 output can start playing before it is
+    # fully read
+    container_args = ['-movflags', '+faststart'] if output_path.endswith('.mp4') else []
+    try:
+        result = subprocess.run(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+             '-f', 'concat', '-safe', '0', '-i', list_path,
+             '-c', 'copy', *container_args, output_path],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to join {output_path}: {result.stderr.decode(errors='replace')}")
+    finally:
+        os.remove(list_path)
+
+def playlist_video_path(playlist_path: str) -> str:
+    """The segments of a finished playlist joined into one MP4, written when it is closed"""
+    return os.path.splitext(playlist_path)[0] + '.mp4'
+
+def timing_path(video_path: str) -> str:
+    """Sidecar file holding the timing track of a rendered video or playlist"""
+    return os.path.splitext(video_path)[0] + '.timing.json'
+
+def write_timing(video_path: str, text: str, entries: List[dict]):
+    """Write the timing track for a render, replacing any previous one"""
+    track = {
+        'version': 1,
+        'text': text,
+        'duration': entries[-1]['end'] if entries else 0.0,
+        'entries': entries,
+    }
+    path = timing_path(video_path)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(track, file, indent=1)
+    os.replace(temp_path, path)
+
+def load_timing(video_path: str) -> Optional[dict]:
+    """Read the timing track written next to a render, or None"""
+    try:
+        with open(timing_path(video_path), encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def segment_duration(path: str) -> float:
+    """Duration of an encoded segment, read from its header without decoding"""
+    return ffmpeg_parse_infos(path)['duration']
+
+def text_word_spans(text: str, word_count: int) -> Optional[List[Tuple[int, int]]]:
+    """Character span in the original text of each word seen by parse_string"""
+    spans = [match.span() for match in re.finditer(r'[A-Za-z0-9]+', text)]
+    return spans if len(spans) == word_count else None
+
+def speed_bucket(speed: float) -> float:
+    """Nearest playback speed with a pre-rendered variant"""
+    return min(SPEED_BUCKETS, key=lambda bucket: abs(bucket - speed))
+
+def speed_variant_path(video_path: str, speed: float) -> str:
+    """Where the variant of a render at a given speed bucket is cached"""
+    root, extension = os.path.splitext(video_path)
+    if extension == '.m3u8':
+        extension = '.mp4'
+    return f"{root}.speed{speed_bucket(speed):g}{extension}"
+
+def speed_variant_paths(video_path: str) -> List[str]:
+    root = os.path.splitext(video_path)[0]
+    return glob.glob(glob.escape(root) + '.speed*')
+
+def render_speed_variant(video_path: str, speed: float, profile: Optional[RenderProfile] = None,
+                         interpolation: str = 'blend') -> Optional[str]:
+    """Re-time a render to play at the given speed at the profile's full frame rate.
+
+    Slow variants synthesize the missing frames with ffmpeg's minterpolate
+    ('blend' is cheap, 'mci' is motion compensated and much slower); fast
+    variants drop frames. The result is cached per speed bucket next to the
+    render, together with a rescaled timing track, and its path returned.
+    A playlist is re-timed from its joined MP4 (see playlist_video_path),
+    so it must have finished rendering.
+    """
+    speed = speed_bucket(speed)
+    if speed == 1.0:
+        return video_path
+    output_path = speed_variant_path(video_path, speed)
+    if os.path.exists(output_path):
+        return output_path
+    source_path = playlist_video_path(video_path) if video_path.endswith('.m3u8') else video_path
+    if not os.path.exists(source_path):
+        logger.warning("Cannot render %gx variant, %s does not exist", speed, source_path)
+        return None
+
+    profile = profile or get_profile()
+    if speed < 1.0:
+        retime = f"setpts=PTS/{speed:g},minterpolate=fps={profile.fps}:mi_mode={interpolation}"
+    else:
+        retime = f"setpts=PTS/{speed:g},fps={profile.fps}"
+    root, extension = os.path.splitext(output_path)
+    partial_path = f"{root}.part{extension}"
+    container_args = ['-movflags', '+faststart'] if extension == '.mp4' else []
+    try:
+        subprocess.run(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error', '-i', source_path,
+             '-vf', retime, '-an', *profile.encoder_args(), '-pix_fmt', 'yuv420p',
+             *container_args, partial_path],
+            check=True, capture_output=True
+        )
+        os.replace(partial_path, output_path)
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = e.stderr.decode(errors='replace').strip() if getattr(e, 'stderr', None) else str(e)
+        logger.error("Error rendering %gx variant of %s: %s", speed, video_path, detail)
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return None
+
+    timing = load_timing(video_path)
+    if timing:
+        entries = [
+            dict(entry, start=round(entry['start'] / speed, 3), end=round(entry['end'] / speed, 3))
+            for entry in timing['entries']
+        ]
+        write_timing(output_path, timing['text'], entries)
+    return output_path
+
+class HlsPlaylist:
+    """HLS event playlist that grows one segment at a time.
+
+    Players can open it as soon as the first segment is listed and pick up
+    later segments as they are appended.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dir = os.path.dirname(os.path.abspath(path))
+        self.entries = []
+        self.offset = 0.0
+        os.makedirs(self.dir, exist_ok=True)
+
+    def append(self, segment_path: str, duration: Optional[float] = None) -> str:
+        """Remux a finished segment to MPEG-TS and list it"""
+        ts_name = f"segment_{len(self.entries)}.ts"
+        if duration is None:
+            duration = segment_duration(segment_path)
+        result = subprocess.run(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error',
+             '-i', segment_path, '-c', 'copy', '-bsf:v', 'h264_mp4toannexb',
+             '-output_ts_offset', f"{self.offset:.3f}", '-f', 'mpegts',
+             os.path.join(self.dir, ts_name)],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to remux {segment_path}: {result.stderr.decode(errors='replace')}")
+        self.entries.append((ts_name, duration))
+        self.offset += duration
+        self.write()
+        return os.path.join(self.dir, ts_name)
+
+    def write(self, final: bool = False):
+        target = max(math.ceil(duration) for _, duration in self.entries) if self.entries else 1
+        lines = [
+            '#EXTM3U',
+            '#EXT-X-VERSION:3',
+            '#EXT-X-PLAYLIST-TYPE:EVENT',
+            f'#EXT-X-TARGETDURATION:{target}',
+            '#EXT-X-MEDIA-SEQUENCE:0',
+        ]
+        for name, duration in self.entries:
+            lines.append(f'#EXTINF:{duration:.3f},')
+            lines.append(name)
+        if final:
+            lines.append('#EXT-X-ENDLIST')
+
+        # Replace atomically so a player never reads a half-written list
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        self.write(final=True)
+
+    @staticmethod
+    def remove(path: str):
+        """Delete a playlist and the segments it owns"""
+        segment_dir = os.path.dirname(os.path.abspath(path))
+        owned = [path, path + '.tmp', timing_path(path), playlist_video_path(path)] + glob.glob(os.path.join(segment_dir, 'segment_*.ts'))
+        for variant in speed_variant_paths(path):
+            owned.extend([variant, timing_path(variant)])
+        for file_path in owned:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+def remove_render_output(path: str):
+    """Delete a rendered video file, or a playlist together with its directory.
+
+    A playlist owns the directory it is written to. Anything still in it
+    (segments, timing track, speed variants, leftovers of an encode that
+    was cut short) is removed with it, so only call this for a playlist
+    once nothing is writing to it any more.
+    """
+    try:
+        if path.endswith('.m3u8'):
+            shutil.rmtree(os.path.dirname(os.path.abspath(path)), ignore_errors=True)
+        else:
+            owned = [path, timing_path(path)]
+            for variant in speed_variant_paths(path):
+                owned.extend([variant, timing_path(variant)])
+            for file_path in owned:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+    except OSError:
+        pass
+
+
+def spelling_items(characters: List[str], videos_path: str, span) -> List[tuple]:
+    """Sequence items for a fingerspelled word.
+
+    Runs of letters become one 'spell' item from the letter cache; anything
+    the cache has no clip for (such as the digits of a number from 10 up)
+    is signed with its own dataset clip.
+    """
+    letter_cache = get_fingerspelling_cache()
+    items = []
+    run = []
+    for character in (c.lower() for c in characters):
+        if letter_cache.has_letter(character):
+            run.append(character)
+            continue
+        if run:
+            items.append(('spell', tuple(run), ''.join(run), span))
+            run = []
+        video_path = find_video(character, videos_path)
+        if video_path:
+            items.append(('clip', video_path, character, span))
+        else:
+            print(f"Warning: Video for '{character}' not found")
+    if run:
+        items.append(('spell', tuple(run), ''.join(run), span))
+    return items
+
+def build_sequence(text: str, dataset: List[str], videos_path: str) -> List[tuple]:
+    """Translate text into the signs to show, in order.
+
+    Each item is (kind, source, gloss, text_span): kind is 'clip' with the
+    path of a dataset clip, or 'spell' with a tuple of letters to
+    fingerspell, and text_span is the character range in text it came from.
+    """
+    original_text = text
+    text = text.lower().strip()
+    text = re.sub(r'[^a-z0-9\s]+', ' ', text)
+    item_spans = []
+    items = parse_string(text, dataset, item_spans)
+    char_spans = text_word_spans(original_text, len(text.split()))
+
+    # Whole-word signs come from the dataset; other words are fingerspelled
+    sequence = []
+    for item, span in zip(items, item_spans):
+        if not item:
+            continue
+        if char_spans and span:
+            span = (char_spans[span[0]][0], char_spans[span[1] - 1][1])
+        else:
+            span = None
+        if isinstance(item, list):
+            sequence.extend(spelling_items(item, videos_path, span))
+            continue
+        video_path = find_video(item, videos_path)
+        if not video_path:
+            print(f"Warning: Video for '{item}' not found")
+            continue
+        sequence.append(('clip', video_path, item, span))
+    return sequence
+
+def text_to_sign(text: str, dataset: List[str], videos_path: str,
+                 output_path: str = "combined.avi",
+                 progress_callback: Optional[Callable[[int, str], None]] = None,
+                 cancel_check: Optional[Callable[[], bool]] = None,
+                 playlist_path: Optional[str] = None,
+                 segment_callback: Optional[Callable[[str, int], None]] = None,
+                 profile: Optional[RenderProfile] = None,
+                 gap: float = GAP_DURATION,
+                 transition: str = DEFAULT_TRANSITION,
+                 segment_cache: Optional[SegmentCache] = None) -> Optional[str]:
+    """Render text to one sign video and return its path, or None if nothing in it can be signed.
+
+    The size, frame rate and encoder settings come from the render profile
+    (the 'standard' profile by default). Signs are separated by gap seconds
+    of the given transition: 'blank', 'hold' (the last frame of the sign
+    before) or 'crossfade'.
+
+    With playlist_path, the result is an HLS playlist instead of a single
+    file: segments are published in sentence order as soon as each one is
+    ready, segment_callback(playlist_path, index) is called for each, and
+    the playlist path is returned.
+
+    A timing track (see timing_path) is written next to the result, listing
+    the gloss, start and end time, source clip and text span of every sign.
+    For playlists it grows with each published segment.
+
+    Segments and transitions are looked up in and stored to segment_cache,
+    the process-wide cache by default. If rendering fails, the partial
+    output is removed and the error raised.
+    """
+    futures = []
+    pinned = []
+    result_path = playlist_path or output_path
+    profile = profile or get_profile()
+    segment_cache = segment_cache or get_segment_cache()
+
+    def check_cancelled():
+        if cancel_check and cancel_check():
+            raise RenderCancelled()
+
+    def report(percent, message):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    try:
+        if playlist_path:
+            HlsPlaylist.remove(playlist_path)
+        else:
+            remove_render_output(output_path)
+
+        sequence = build_sequence(text, dataset, videos_path)
+        if not sequence:
+            return None
+
+        # Segments already in the cache from earlier renders are reused as
+        # they are, and repeated letters, words and spellings are prepared
+        # only once. Gaps are separate segments from the transition library.
+        letter_cache = get_fingerspelling_cache()
+        transitions = get_transition_library()
+        if transitions.segment_cache is not segment_cache:
+            transitions = TransitionLibrary(segment_cache)
+        spell_settings = (letter_cache.videos_path, letter_cache.size, letter_cache.fps, GAP_DURATION)
+        jobs = {}
+        order = []
+        for kind, source, _, _ in sequence:
+            key = (kind, source)
+            if key not in jobs:
+                settings = spell_settings if kind == 'spell' else ()
+                jobs[key] = segment_cache.path_for(profile, kind, source, 0.0, settings)
+            order.append(key)
+        # Other renders prune the cache while this one runs; hold on to
+        # every segment it uses until it has been joined
+        pinned.extend(jobs.values())
+        segment_cache.pin(pinned)
+
+        ready = {key: path for key, path in jobs.items() if segment_cache.lookup(path)}
+        missing = [key for key in jobs if key not in ready]
+        partials = {key: segment_cache.partial_path(jobs[key]) for key in missing}
+        clip_queue = [key for key in missing if key[0] == 'clip']
+        pending = {}
+
+        def prepare_ahead():
+            # Keep a bounded number of clips in preparation ahead of the
+            # walk, so long sentences never queue every clip at once
+            while clip_queue and sum(1 for key in pending if key not in ready) < READ_AHEAD:
+                key = clip_queue.pop(0)
+                pending[key] = get_process_pool().submit(prepare_segment, key[1], partials[key], profile)
+                futures.append(pending[key])
+
+        playlist = HlsPlaylist(playlist_path) if playlist_path else None
+
+        # Walk the sentence in order: spelled words are encoded on this
+        # thread while the pool decodes the clips further ahead
+        segments = []
+        timing = []
+        position = 0.0
+        for index, key in enumerate(order):
+            check_cancelled()
+            prepare_ahead()
+            kind, source = key
+            if key not in ready:
+                if kind == 'spell':
+                    partial = letter_cache.render(source, partials[key], profile.size, profile.fps,
+                                                  gap=GAP_DURATION, encoder_args=profile.encoder_args())
+                else:
+                    partial = pending[key].result()
+                ready[key] = segment_cache.store(partial, jobs[key])
+            report(int(90 * (index + 1) / len(order)), f"Preparing sign {index + 1} of {len(order)}")
+            if not ready[key]:
+                continue
+
+            parts = []
+            if segments and gap > 0:
+                between = transitions.get(transition, profile, gap, before=segments[-1], after=ready[key])
+                if between:
+                    segment_cache.pin([between])
+                    pinned.append(between)
+                    parts.append(between)
+            parts.append(ready[key])
+
+            _, _, gloss, span = sequence[index]
+            for part in parts:
+                duration = segment_cache.duration(part, segment_duration)
+                if part is ready[key]:
+                    timing.append({
+                        'gloss': gloss,
+                        'start': round(position, 3),
+                        'end': round(position + duration, 3),
+                        'source': source if kind == 'clip' else None,
+                        'fingerspelled': kind == 'spell',
+                        'text_span': list(span) if span else None,
+                    })
+                position += duration
+                segments.append(part)
+                if playlist:
+                    playlist.append(part, duration)
+
+            if playlist:
+                write_timing(playlist_path, text, timing)
+                if segment_callback:
+                    segment_callback(playlist_path, len(timing) - 1)
+
+        if not segments:
+            return None
+
+        check_cancelled()
+        if playlist:
+            playlist.close()
+            # Speed variants are made from one file: a stream copy of the
+            # segments rather than a second pass through the MPEG-TS
+            concat_segments(segments, playlist_video_path(playlist_path))
+        else:
+            report(90, "Joining video")
+            concat_segments(segments, output_path)
+            write_timing(output_path, text, timing)
+        # Only make room once this render no longer needs its segments
+        if missing:
+            segment_cache.prune()
+        report(100, "Done")
+
+        return result_path
+
+    except Exception:
+        # Drop the partial output of a superseded or failed render
+        try:
+            if playlist_path:
+                HlsPlaylist.remove(playlist_path)
+            else:
+                remove_render_output(output_path)
+        except OSError:
+            pass
+        raise
+
+    finally:
+        for future in futures:
+            future.cancel()
+        segment_cache.unpin(pinned)
+
+
+def stream_text_to_sign(text: str, dataset: List[str], videos_path: str,
+                        output_path: str = "combined.avi",
+                        progress_callback: Optional[Callable[[int, str], None]] = None,
+                        cancel_check: Optional[Callable[[], bool]] = None,
+                        profile: Optional[RenderProfile] = None,
+                        gap: float = GAP_DURATION) -> Optional[str]:
+    """Render text like text_to_sign, holding one source clip open at a time.
+
+    Every clip and letter is decoded in turn into a single encoder, so
+    there are never more than two ffmpeg processes and a couple of frames
+    in memory however long the text is. Nothing is parallelized or cached,
+    which suits long inputs and memory-constrained hosts. The timing track
+    is computed from the frames written. Errors are raised as they are by
+    text_to_sign.
+    """
+    profile = profile or get_profile()
+
+    def check_cancelled():
+        if cancel_check and cancel_check():
+            raise RenderCancelled()
+
+    def report(percent, message):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    remove_render_output(output_path)
+    sequence = build_sequence(text, dataset, videos_path)
+    if not sequence:
+        return None
+
+    letter_cache = get_fingerspelling_cache()
+    compositor = FrameCompositor(output_path, profile.size, profile.fps, profile.encoder_args())
+    timing = []
+    try:
+        for index, (kind, source, gloss, span) in enumerate(sequence):
+            check_cancelled()
+            start = compositor.frames_written
+            if kind == 'clip':
+                compositor.add_clip(source)
+            else:
+                letters = [path for path in map(letter_cache.letter_path, source) if path]
+                for i, letter_path in enumerate(letters):
+                    compositor.add_clip(letter_path)
+                    if i < len(letters) - 1:
+                        compositor.add_gap(GAP_DURATION)
+            if compositor.frames_written > start:
+                timing.append({
+                    'gloss': gloss,
+                    'start': round(start / profile.fps, 3),
+                    'end': round(compositor.frames_written / profile.fps, 3),
+                    'source': source if kind == 'clip' else None,
+                    'fingerspelled': kind == 'spell',
+                    'text_span': list(span) if span else None,
+                })
+                if index < len(sequence) - 1:
+                    compositor.add_gap(gap)
+            report(int(100 * (index + 1) / len(sequence)), f"Rendering sign {index + 1} of {len(sequence)}")
+    except Exception:
+        compositor.abort()
+        remove_render_output(output_path)
+        raise
+
+    if not compositor.close():
+        remove_render_output(output_path)
+        return None
+    write_timing(output_path, text, timing)
+    return output_path
@@ -0,0 +1,176 @@
+"""Render a sign video track for a subtitle file.
+
+Each SRT or WebVTT cue is translated with the same rules as the
+Text-to-Sign tab and placed at the cue's start time, so the result can be
+shown next to the captioned recording:
+
+    python -m ui.subtitle_render lecture.srt -o lecture.sign.mp4 --workers 4
+
+Cues are rendered in parallel and share the segment cache, so signs that
+repeat across a lecture are only encoded once. Nothing on this path
+imports Qt.
+"""
+
+# Standard library imports
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional
+
+from ui.compositor import FrameCompositor
+from ui.render_profiles import PROFILES, get_profile
+from ui.segment_cache import get_segment_cache
+from ui.sign_render import (
+    text_to_sign, load_dataset, load_timing, remove_render_output, segment_duration, DATASET_PATH
+)
+
+MAX_SPEEDUP = 1.5  # Faster than this and signs become hard to follow
+
+TIMESTAMP = r'(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{3})'
+CUE_TIMING = re.compile(TIMESTAMP + r'\s*-->\s*' + TIMESTAMP)
+MARKUP = re.compile(r'<[^>]*>|\{[^}]*\}')
+
+
+class Cue(NamedTuple):
+    start: float
+    end: float
+    text: str
+
+
+# Helper functions
+def to_seconds(hours, minutes, seconds, millis) -> float:
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(millis) / 1000
+
+def parse_subtitles(path: str) -> List[Cue]:
+    """Read the cues of an SRT or WebVTT file in time order, without markup"""
+    with open(path, encoding='utf-8-sig') as file:
+        blocks = re.split(r'\n\s*\n', file.read().replace('\r\n', '\n'))
+
+    cues = []
+    for block in blocks:
+        lines = block.strip().split('\n')
+        for i, line in enumerate(lines):
+            match = CUE_TIMING.search(line)
+            if match:
+                text = ' '.join(MARKUP.sub('', text_line).strip() for text_line in lines[i + 1:])
+                text = ' '.join(text.split())
+                if text:
+                    cues.append(Cue(to_seconds(*match.groups()[:4]), to_seconds(*match.groups()[4:]), text))
+                break
+    return sorted(cues, key=lambda cue: cue.start)
+
+def count_words(text: str) -> int:
+    return len(re.findall(r'[A-Za-z0-9]+', text))
+
+
+class CueResult(NamedTuple):
+    cue: Cue
+    path: Optional[str]
+    words: int
+    fingerspelled: int
+
+
+def render_cue(index: int, cue: Cue, dataset, dataset_path: str, work_dir: str, profile) -> CueResult:
+    output_path = os.path.join(work_dir, f"cue_{index}.{profile.container}")
+    try:
+        path = text_to_sign(cue.text, dataset, dataset_path, output_path=output_path, profile=profile)
+    except Exception as e:
+        print(f"Warning: cue {index + 1} ({cue.text!r}) failed to render: {e}")
+        path = None
+    timing = load_timing(path) if path else None
+    fingerspelled = sum(1 for entry in timing['entries'] if entry['fingerspelled']) if timing else 0
+    return CueResult(cue, path, count_words(cue.text), fingerspelled)
+
+def assemble_track(results: List[CueResult], output_path: str, profile, max_speedup: float = MAX_SPEEDUP) -> int:
+    """Lay the cue videos out on one timeline, returning how many overran their cue.
+
+    Blank frames fill the time between cues. A cue video longer than the
+    time until the next cue is sped up, up to max_speedup; beyond that it
+    runs over and pushes the following cues back. A cue whose slot has
+    already passed by the time it starts is played at max_speedup to catch
+    up, and also counts as an overrun.
+    """
+    compositor = FrameCompositor(output_path, profile.size, profile.fps, profile.encoder_args())
+    overruns = 0
+    try:
+        for i, result in enumerate(results):
+            if not result.path:
+                continue
+            start_frame = int(round(result.cue.start * profile.fps))
+            if start_frame > compositor.frames_written:
+                compositor.add_gap((start_frame - compositor.frames_written) / profile.fps)
+
+            duration = segment_duration(result.path)
+            following = [later.cue.start for later in results[i + 1:] if later.path]
+            window = following[0] - compositor.frames_written / profile.fps if following else None
+            speed = 1.0
+            if window is not None and duration > window:
+                speed = min(duration / window, max_speedup) if window > 0 else max_speedup
+                if window <= 0 or duration / speed > window + 1 / profile.fps:
+                    overruns += 1
+            compositor.add_clip(result.path, speed)
+    except Exception:
+        compositor.abort()
+        raise
+    compositor.close()
+    return overruns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui.subtitle_render", description="Render a sign video track for an SRT or WebVTT file")
+    parser.add_argument('subtitles', help="SRT or WebVTT file")
+    parser.add_argument('-o', '--output', help="Output video (default: next to the subtitles)")
+    parser.add_argument('--dataset', default=DATASET_PATH, help="Directory of sign clips")
+    parser.add_argument('--profile', default='standard', choices=list(PROFILES), help="Render quality profile")
+    parser.add_argument('--workers', type=int, default=2, help="Cues to render at the same time")
+    parser.add_argument('--max-speedup', type=float, default=MAX_SPEEDUP, help="Fastest a cue may be played to fit its slot")
+    args = parser.parse_args(argv)
+
+    profile = get_profile(args.profile)
+    output_path = args.output or f"{os.path.splitext(args.subtitles)[0]}.sign.{profile.container}"
+    cues = parse_subtitles(args.subtitles)
+    if not cues:
+        parser.error("no cues found")
+
+    dataset = load_dataset(args.dataset)
+    segment_cache = get_segment_cache()
+    hits, misses = segment_cache.hits, segment_cache.misses
+    work_dir = tempfile.mkdtemp(prefix="subtitle_render_")
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="cue") as executor:
+            futures = [
+                executor.submit(render_cue, i, cue, dataset, args.dataset, work_dir, profile)
+                for i, cue in enumerate(cues)
+            ]
+            results = [future.result() for future in futures]
+        rendered = time.perf_counter() - start
+        print(f"Rendered {len(cues)} cues in {rendered:.1f}s, assembling {output_path}")
+        overruns = assemble_track(results, output_path, profile, args.max_speedup)
+        for result in results:
+            if result.path:
+                remove_render_output(result.path)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    elapsed = time.perf_counter() - start
+
+    words = sum(result.words for result in results)
+    fingerspelled = sum(result.fingerspelled for result in results)
+    failed = sum(1 for result in results if not result.path)
+    lookups = (segment_cache.hits - hits) + (segment_cache.misses - misses)
+    hit_rate = (segment_cache.hits - hits) / lookups if lookups else 0.0
+    print(f"{len(cues) / (elapsed / 60):.1f} cues/min ({elapsed:.1f}s total), "
+          f"{fingerspelled}/{words} words fingerspelled ({fingerspelled / words if words else 0:.1%}), "
+          f"segment cache hit rate {hit_rate:.1%}")
+    if overruns or failed:
+        print(f"{overruns} cues overran their slot, {failed} cues produced no video")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
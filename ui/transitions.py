@@ -0,0 +1,78 @@
+# Standard library imports
+import threading
+from typing import Optional
+
+from ui.compositor import FrameCompositor, read_frame
+from ui.render_profiles import PROFILES
+from ui.segment_cache import SegmentCache, get_segment_cache
+
+# Transitions between signs are encoded once per render profile and stored
+# in the segment cache like the signs themselves, so joining a sentence
+# stream-copies them instead of encoding a gap every time. A blank gap only
+# depends on the profile and duration; holding the last frame depends on
+# the sign before it, and a crossfade on the signs on both sides.
+
+TRANSITIONS = ('blank', 'hold', 'crossfade')
+DEFAULT_TRANSITION = 'blank'
+
+
+class TransitionLibrary:
+    """Pre-encoded gaps and transitions for joining sign segments"""
+
+    def __init__(self, segment_cache: Optional[SegmentCache] = None):
+        self.segment_cache = segment_cache or get_segment_cache()
+
+    def get(self, kind: str, profile, duration: float,
+            before: Optional[str] = None, after: Optional[str] = None) -> Optional[str]:
+        """Return a transition segment between two encoded signs, encoding it on first use"""
+        if kind not in TRANSITIONS:
+            raise ValueError(f"Unknown transition '{kind}', expected one of: {', '.join(TRANSITIONS)}")
+        if duration <= 0:
+            return None
+        neighbours = {'blank': (), 'hold': (before,), 'crossfade': (before, after)}[kind]
+        path = self.segment_cache.path_for(profile, 'transition', (kind,) + neighbours, duration)
+        if self.segment_cache.lookup(path):
+            return path
+
+        partial = self.segment_cache.partial_path(path)
+        compositor = FrameCompositor(partial, profile.size, profile.fps, profile.encoder_args())
+        try:
+            if kind == 'blank':
+                compositor.add_gap(duration)
+            elif kind == 'hold':
+                compositor.add_still(read_frame(before, profile.size, last=True) or compositor.black_frame, duration)
+            else:
+                first = read_frame(before, profile.size, last=True) or compositor.black_frame
+                last = read_frame(after, profile.size) or compositor.black_frame
+                compositor.add_crossfade(first, last, duration)
+        except Exception:
+            compositor.abort()
+            raise
+        return self.segment_cache.store(compositor.close(), path)
+
+    def prebuild(self, profiles, durations):
+        """Encode the blank gaps ahead of time"""
+        for profile in profiles:
+            for duration in durations:
+                self.get('blank', profile, duration)
+
+
+_library = None
+_library_lock = threading.Lock()
+
+
+def get_transition_library() -> TransitionLibrary:
+    """Process-wide transition library, created on first use"""
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = TransitionLibrary()
+        return _library
+
+
+if __name__ == "__main__":
+    # Pre-encode the default gap for every profile
+    from ui.sign_render import GAP_DURATION
+
+    get_transition_library().prebuild(PROFILES.values(), [GAP_DURATION])
+    print(f"Blank gaps ready for: {', '.join(PROFILES)}")
@@ -0,0 +1,158 @@
+"""Poster frames and short animated previews for the bundled sign clips.
+
+A video popup shows nothing until the media backend has opened the clip
+and decoded its first frame. Each clip gets a poster (its first frame, as
+a small JPEG) and a preview (its first seconds, as a small animated WebP)
+that can be shown straight away while the player warms up:
+
+    python -m ui.video_previews --workers 4
+
+The app runs the same indexing in the background on startup, so only
+clips added or changed since the last run are processed. A clip that
+cannot be indexed (such as a Git LFS pointer that was never fetched) is
+recorded as failed and skipped until it changes, or until the command is
+run with --retry-failed. Nothing on this path imports Qt.
+"""
+
+# Standard library imports
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+# Third-party imports
+from moviepy.config import get_setting
+
+from ui.assets import PACKAGE_DIR, get_asset_registry
+
+PREVIEW_FORMAT_VERSION = 1  # Bump when the way previews are made changes
+PREVIEW_CACHE_DIR = os.path.join(PACKAGE_DIR, "cache", "previews", f"v{PREVIEW_FORMAT_VERSION}")
+
+POSTER_WIDTH = 400
+PREVIEW_WIDTH = 240
+PREVIEW_FPS = 8
+PREVIEW_SECONDS = 2.0
+
+
+def _cache_base(video_path: str) -> str:
+    """Cache path without extension for a clip, named after its path, size and mtime"""
+    stat = os.stat(video_path)
+    key = repr((os.path.abspath(video_path), stat.st_size, stat.st_mtime_ns))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(PREVIEW_CACHE_DIR, digest[:2], digest)
+
+def preview_paths(video_path: str) -> Tuple[str, str]:
+    """Poster and preview files of a clip"""
+    base = _cache_base(video_path)
+    return f"{base}.jpg", f"{base}.webp"
+
+def failure_path(video_path: str) -> str:
+    """Marker holding why a clip could not be indexed, for as long as it is unchanged"""
+    return f"{_cache_base(video_path)}.failed"
+
+def cached_poster(video_path: str) -> Optional[str]:
+    try:
+        poster, _ = preview_paths(video_path)
+    except OSError:
+        return None
+    return poster if os.path.exists(poster) else None
+
+def cached_preview(video_path: str) -> Optional[str]:
+    try:
+        _, preview = preview_paths(video_path)
+    except OSError:
+        return None
+    return preview if os.path.exists(preview) else None
+
+def _encode(output_path: str, args: List[str]):
+    """Run ffmpeg into a temporary file and move it into place when it succeeds"""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    root, extension = os.path.splitext(output_path)
+    partial = f"{root}.{os.getpid()}.part{extension}"
+    try:
+        subprocess.run(
+            [get_setting("FFMPEG_BINARY"), '-y', '-loglevel', 'error', *args, partial],
+            check=True, capture_output=True
+        )
+        os.replace(partial, output_path)
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+def build_previews(video_path: str) -> Tuple[str, str]:
+    """Make the poster and preview of a clip if they are missing, returning their paths"""
+    poster, preview = preview_paths(video_path)
+    if not os.path.exists(poster):
+        _encode(poster, ['-i', video_path, '-frames:v', '1', '-an',
+                         '-vf', f'scale={POSTER_WIDTH}:-2', '-q:v', '5'])
+    if not os.path.exists(preview):
+        _encode(preview, ['-t', str(PREVIEW_SECONDS), '-i', video_path, '-an',
+                          '-vf', f'fps={PREVIEW_FPS},scale={PREVIEW_WIDTH}:-2',
+                          '-c:v', 'libwebp_anim', '-loop', '0', '-quality', '50'])
+    return poster, preview
+
+def find_clips() -> List[str]:
+    """Every clip in the assets/*_videos folders"""
+    registry = get_asset_registry()
+    return [clip for directory in registry.directories() if directory.endswith('_videos')
+            for clip in registry.files(directory)]
+
+def record_failure(video_path: str, reason: str):
+    try:
+        marker = failure_path(video_path)
+        os.makedirs(os.path.dirname(marker), exist_ok=True)
+        with open(marker, 'w', encoding='utf-8') as file:
+            file.write(reason + '\n')
+    except OSError:
+        pass
+
+def index_clips(clips: List[str], workers: int = 2, retry_failed: bool = False) -> Tuple[int, int]:
+    """Build previews for every clip, returning how many succeeded and failed.
+
+    Clips that failed on an earlier run and have not changed since are
+    counted as failed without trying again, unless retry_failed is set.
+    """
+    def build(path):
+        try:
+            if not retry_failed and os.path.exists(failure_path(path)):
+                return False
+            build_previews(path)
+            if retry_failed and os.path.exists(failure_path(path)):
+                os.remove(failure_path(path))
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None)
+            reason = stderr.decode(errors='replace').strip().splitlines()[-1] if stderr else str(e)
+            print(f"Warning: no preview for {os.path.relpath(path, PACKAGE_DIR)}: {reason}")
+            record_failure(path, reason)
+            return False
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preview") as executor:
+        results = list(executor.map(build, clips))
+    return results.count(True), results.count(False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui.video_previews", description="Build poster frames and previews for the sign clips")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help="Clips to process at the same time")
+    parser.add_argument('--retry-failed', action='store_true', help="Try again on clips that failed on an earlier run")
+    args = parser.parse_args(argv)
+
+    clips = find_clips()
+    start = time.perf_counter()
+    built, failed = index_clips(clips, args.workers, args.retry_failed)
+    elapsed = time.perf_counter() - start
+
+    size = sum(os.path.getsize(os.path.join(directory, name))
+               for directory, _, names in os.walk(PREVIEW_CACHE_DIR) for name in names)
+    print(f"{built} of {len(clips)} clips indexed in {elapsed:.1f}s, "
+          f"{size / 1024 / 1024:.1f} MiB in {PREVIEW_CACHE_DIR}")
+    return 1 if failed and not built else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())